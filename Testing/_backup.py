@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Name of Service: Testing Backup Copy
+Filename: _backup.py
+Version: 1.0.0
+Last Updated: 2026-10-18
+REVISION HISTORY:
+v1.0.0 (2026-10-18) - Shared backup copy for the Testing fix scripts
+  - Clones the file (FICLONE) on filesystems with copy-on-write support
+  - Falls back to shutil.copy2 everywhere else
+
+DESCRIPTION:
+The fix scripts back up a service file before rewriting it. On Btrfs,
+XFS and other reflink-capable filesystems clone_file() makes that backup
+without reading or writing the file data. The clone is a separate inode,
+so rewriting the original afterwards leaves the backup untouched (a hard
+link would not: truncating the original would empty the backup too).
+"""
+
+import shutil
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# ioctl request number for FICLONE from linux/fs.h
+FICLONE = 0x40049409
+
+
+def clone_file(src, dst):
+    """Copy src to dst with its metadata, as a copy-on-write clone where supported"""
+    if FCNTL_AVAILABLE:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # no reflink support here, do a normal copy
+    shutil.copy2(src, dst)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Name of Service: Schedule Proxy Blueprint
+Filename: schedule_proxy_blueprint.py
+Version: 1.0.0
+REVISION HISTORY:
+v1.0.0 - Schedule endpoints for the coordination service
+  - Proxies /schedule/status and /schedule/config to the scheduler service
+  - Falls back to a disabled schedule when the scheduler is not available
+
+DESCRIPTION:
+Flask blueprint that adds the schedule endpoints to the coordination
+service without editing its routes. Register it in _setup_routes:
+
+    from schedule_proxy_blueprint import bp
+    self.app.register_blueprint(bp)
+"""
+
+import logging
+
+import requests
+from flask import Blueprint, jsonify, request
+
+SCHEDULER_URL = 'http://localhost:5011'
+
+bp = Blueprint('schedule_proxy', __name__)
+logger = logging.getLogger(__name__)
+
+# Keep-alive connection to the scheduler shared by every proxied request
+_session = requests.Session()
+
+@bp.route('/schedule/status', methods=['GET'])
+def get_schedule_status():
+    """Proxy schedule status to scheduler service"""
+    try:
+        # Forward to scheduler service
+        response = _session.get(f'{SCHEDULER_URL}/status', timeout=5)
+        if response.status_code == 200:
+            return jsonify(response.json())
+    except Exception as e:
+        logger.error(f"Error getting schedule status: {e}")
+
+    return jsonify({
+        "enabled": False,
+        "message": "Scheduler service not available",
+        "next_run": None
+    })
+
+@bp.route('/schedule/config', methods=['GET', 'POST'])
+def schedule_config():
+    """Proxy schedule config to scheduler service"""
+    if request.method == 'GET':
+        try:
+            response = _session.get(f'{SCHEDULER_URL}/config', timeout=5)
+            if response.status_code == 200:
+                return jsonify(response.json())
+        except Exception as e:
+            logger.error(f"Error getting schedule config: {e}")
+
+        # Default config if scheduler not available
+        return jsonify({
+            "enabled": False,
+            "interval_minutes": 30,
+            "market_hours_only": True,
+            "start_time": "09:30",
+            "end_time": "16:00"
+        })
+
+    else:  # POST
+        try:
+            # Forward config to scheduler
+            response = _session.post(f'{SCHEDULER_URL}/config',
+                                     json=request.json, timeout=5)
+            if response.status_code == 200:
+                return jsonify(response.json())
+            else:
+                return jsonify({"error": "Failed to update scheduler config"}), 500
+        except Exception as e:
+            logger.error(f"Error updating schedule config: {e}")
+            return jsonify({"error": str(e)}), 500
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Name of Service: Testing Path Resolver
+Filename: _paths.py
+Version: 1.0.1
+Last Updated: 2026-10-18
+REVISION HISTORY:
+v1.0.1 (2026-10-18) - Only regular files match, a same-named folder is skipped
+v1.0.0 (2026-10-18) - Shared project file lookup for Testing scripts
+  - Resolves files relative to the parent folder or the current folder
+  - Caches each lookup so repeated calls do not stat again
+
+DESCRIPTION:
+The Testing scripts can be run from inside the Testing folder or from
+the project root. find() returns the first existing location of a
+project file so each script does not need its own exists() checks.
+"""
+
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=None)
+def find(name, candidates=('..', '.')):
+    """Return the path of a project file, checking each candidate folder in order"""
+    for directory in candidates:
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(name)
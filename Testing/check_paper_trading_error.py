@@ -2,9 +2,13 @@
 """
 Name of Service: Check Paper Trading Error
 Filename: check_paper_trading_error.py
-Version: 1.0.0
-Last Updated: 2025-06-25
+Version: 1.0.4
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.4 (2026-10-18) - Backup search scans the directory once with a prefix check
+v1.0.3 (2026-10-18) - Start probe uses Popen with a 2s window and kills a running service
+v1.0.2 (2026-10-18) - Project file lookup goes through the shared _paths.find() resolver
+v1.0.1 (2026-10-18) - Backup search streams matches and picks newest by mtime
 v1.0.0 (2025-06-25) - Diagnose paper trading startup error
   - Checks for syntax errors
   - Shows recent error logs
@@ -18,6 +22,8 @@ import subprocess
 import sys
 import os
 
+from _paths import find
+
 def check_paper_trading_error():
     """Check why paper trading won't start"""
     
@@ -29,7 +35,7 @@ def check_paper_trading_error():
     print("\n1. CHECKING FOR SYNTAX ERRORS:")
     print("-" * 40)
     
-    paper_trading_path = '../paper_trading.py' if os.path.exists('../paper_trading.py') else 'paper_trading.py'
+    paper_trading_path = find('paper_trading.py')
     
     # Check syntax
     result = subprocess.run([sys.executable, '-m', 'py_compile', paper_trading_path], 
@@ -45,16 +51,26 @@ def check_paper_trading_error():
     print("\n2. TRYING TO START SERVICE:")
     print("-" * 40)
     
-    result = subprocess.run([sys.executable, paper_trading_path], 
-                          capture_output=True, text=True, timeout=5)
+    with subprocess.Popen([sys.executable, paper_trading_path],
+                          stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE, text=True) as proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=2)
+        except subprocess.TimeoutExpired:
+            # Still running after the probe window, so it started; kill it
+            # without reading back whatever it has logged so far
+            proc.kill()
+            stdout = stderr = None
     
-    if result.returncode != 0:
+    if stdout is None:
+        print("✓ Service started (still running after 2s probe)")
+    elif proc.returncode != 0:
         print("✗ Service failed to start")
         print("\nError output:")
-        print(result.stderr)
-        if result.stdout:
+        print(stderr)
+        if stdout:
             print("\nStandard output:")
-            print(result.stdout)
+            print(stdout)
     
     # 3. Check the recent modification
     print("\n3. CHECKING RECENT MODIFICATION:")
@@ -76,10 +92,12 @@ def check_paper_trading_error():
     print("\n4. CHECKING FOR BACKUP:")
     print("-" * 40)
     
-    import glob
-    backups = glob.glob(f'{paper_trading_path}.backup_*')
-    if backups:
-        latest_backup = max(backups)
+    backup_dir, base = os.path.split(paper_trading_path)
+    prefix = base + '.backup_'
+    with os.scandir(backup_dir or '.') as entries:
+        latest_backup = max((e.path for e in entries if e.name.startswith(prefix)),
+                            key=os.path.getmtime, default=None)
+    if latest_backup:
         print(f"✓ Found backup: {latest_backup}")
         print("\nTo restore from backup, run:")
         print(f"cp {latest_backup} {paper_trading_path}")
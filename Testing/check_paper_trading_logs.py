@@ -2,9 +2,16 @@
 """
 Name of Service: Check Paper Trading Logs
 Filename: check_paper_trading_logs.py
-Version: 1.0.0
-Last Updated: 2025-06-25
+Version: 1.0.7
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.7 (2026-10-18) - Summary counts search the mapped file in place and count matching lines
+v1.0.6 (2026-10-18) - Summary counts scan the mmapped log at the byte level
+v1.0.5 (2026-10-18) - Patterns compiled once into a single named-group alternation
+v1.0.4 (2026-10-18) - Lowercase each scanned line once per iteration
+v1.0.3 (2026-10-18) - Cheap substring prefilter before the pattern search
+v1.0.2 (2026-10-18) - Project file lookup goes through the shared _paths.find() resolver
+v1.0.1 (2026-10-18) - Timestamp taken from the fixed 19-char log prefix
 v1.0.0 (2025-06-25) - Check paper trading logs for errors
   - Finds Alpaca connection errors
   - Shows credential loading messages
@@ -15,10 +22,57 @@ This script analyzes the paper trading service log to find
 the actual error that's causing the Alpaca connection to fail.
 """
 
+import mmap
 import os
 import re
 from datetime import datetime
 
+from _paths import find
+
+# Patterns to look for
+PATTERNS = {
+    'credential_loaded': r'credentials loaded from environment',
+    'credential_not_found': r'credentials not found',
+    'error_alpaca': r'Error.*Alpaca.*API',
+    'connected': r'Connected to Alpaca',
+    'simulation': r'simulation mode',
+    'api_error': r'401|403|authentication|unauthorized',
+    'import_error': r'ImportError|ModuleNotFoundError',
+    'setup_alpaca': r'setup.*alpaca',
+    'alpaca_available': r'ALPACA_AVAILABLE'
+}
+
+# All patterns as one alternation; match.lastgroup names the category
+PATTERNS_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in PATTERNS.items()),
+                         re.IGNORECASE)
+
+# Lowercase literals that every pattern above needs at least one of; lines
+# without any of them cannot match and skip the regex search entirely
+_CHEAP_HITS = ('alpaca', 'credential', 'simulation', '401', '403',
+               'unauthorized', 'authentication', 'importerror',
+               'modulenotfounderror')
+
+# Phrases counted for the log statistics, searched directly in the mapped file
+SIMULATION_RE = re.compile(rb'simulation mode', re.IGNORECASE)
+CONNECTED_RE = re.compile(rb'connected to alpaca', re.IGNORECASE)
+
+def count_lines_in_file(path, patterns):
+    """Count the lines of the file that match each compiled bytes pattern"""
+    if os.path.getsize(path) == 0:
+        return [0] * len(patterns)
+    counts = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for pattern in patterns:
+            count = pos = 0
+            while (match := pattern.search(mm, pos)):
+                count += 1
+                # Resume on the next line so each line is counted once
+                pos = mm.find(b'\n', match.end()) + 1
+                if pos == 0:
+                    break
+            counts.append(count)
+    return counts
+
 def check_logs():
     """Check paper trading logs for Alpaca errors"""
     
@@ -26,10 +80,10 @@ def check_logs():
     print("PAPER TRADING LOG ANALYSIS")
     print("=" * 60)
     
-    log_path = '../logs/paper_trading_service.log' if os.path.exists('../logs/paper_trading_service.log') else './logs/paper_trading_service.log'
-    
-    if not os.path.exists(log_path):
-        print(f"✗ Log file not found at: {log_path}")
+    try:
+        log_path = find(os.path.join('logs', 'paper_trading_service.log'))
+    except FileNotFoundError:
+        print("✗ Log file not found at: ./logs/paper_trading_service.log")
         return
     
     print(f"Analyzing: {log_path}")
@@ -39,19 +93,6 @@ def check_logs():
     with open(log_path, 'r') as f:
         lines = f.readlines()
     
-    # Patterns to look for
-    patterns = {
-        'credential_loaded': r'credentials loaded from environment',
-        'credential_not_found': r'credentials not found',
-        'error_alpaca': r'Error.*Alpaca.*API',
-        'connected': r'Connected to Alpaca',
-        'simulation': r'simulation mode',
-        'api_error': r'401|403|authentication|unauthorized',
-        'import_error': r'ImportError|ModuleNotFoundError',
-        'setup_alpaca': r'setup.*alpaca',
-        'alpaca_available': r'ALPACA_AVAILABLE'
-    }
-    
     # Collect relevant lines
     relevant_lines = []
     
@@ -60,16 +101,19 @@ def check_logs():
     
     # Look at last 200 lines
     for i, line in enumerate(lines[-200:]):
-        for pattern_name, pattern in patterns.items():
-            if re.search(pattern, line, re.IGNORECASE):
-                # Get the timestamp if available
-                timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                if timestamp_match:
-                    timestamp = timestamp_match.group(1)
-                    relevant_lines.append((timestamp, pattern_name, line.strip()))
-                else:
-                    relevant_lines.append(('No timestamp', pattern_name, line.strip()))
-                break
+        low = line.lower()
+        if not any(hit in low for hit in _CHEAP_HITS):
+            continue
+        match = PATTERNS_RE.search(line)
+        if match:
+            # Get the timestamp if available (logs use a fixed
+            # 'YYYY-MM-DD HH:MM:SS' prefix)
+            ts = line[:19]
+            if len(ts) == 19 and ts[4] == '-' and ts[7] == '-' and ts[10] == ' ' and ts[13] == ':':
+                timestamp = ts
+            else:
+                timestamp = 'No timestamp'
+            relevant_lines.append((timestamp, match.lastgroup, line.strip()))
     
     # Sort by timestamp (most recent first)
     relevant_lines.sort(reverse=True)
@@ -89,14 +133,14 @@ def check_logs():
     print("-" * 40)
     
     # Check for import errors
-    import_errors = [line for line in lines if 'alpaca' in line.lower() and ('import' in line.lower() or 'module' in line.lower())]
+    import_errors = [line for line in lines if 'alpaca' in (ll := line.lower()) and ('import' in ll or 'module' in ll)]
     if import_errors:
         print("\nImport-related errors found:")
         for error in import_errors[-3:]:
             print(f"  {error.strip()}")
     
     # Check for authentication errors
-    auth_errors = [line for line in lines if any(word in line.lower() for word in ['401', '403', 'unauthorized', 'authentication'])]
+    auth_errors = [line for line in lines if (ll := line.lower()) and any(word in ll for word in ('401', '403', 'unauthorized', 'authentication'))]
     if auth_errors:
         print("\nAuthentication errors found:")
         for error in auth_errors[-3:]:
@@ -115,7 +159,8 @@ def check_logs():
     
     startup_lines = []
     for i, line in enumerate(lines):
-        if any(phrase in line.lower() for phrase in ['starting paper trading', 'paper trading service', 'initialized']):
+        ll = line.lower()
+        if any(phrase in ll for phrase in ['starting paper trading', 'paper trading service', 'initialized']):
             # Get next 10 lines after startup
             for j in range(i, min(i+10, len(lines))):
                 startup_lines.append(lines[j].strip())
@@ -131,9 +176,8 @@ def check_logs():
     print("=" * 60)
     
     # Count occurrences
-    simulation_count = sum(1 for line in lines if 'simulation mode' in line.lower())
-    connected_count = sum(1 for line in lines if 'connected to alpaca' in line.lower())
-    error_count = sum(1 for line in lines if 'error' in line.lower() and 'alpaca' in line.lower())
+    simulation_count, connected_count = count_lines_in_file(log_path, (SIMULATION_RE, CONNECTED_RE))
+    error_count = sum(1 for line in lines if 'error' in (ll := line.lower()) and 'alpaca' in ll)
     
     print(f"\nLog statistics:")
     print(f"  - Times entered simulation mode: {simulation_count}")
@@ -2,9 +2,13 @@
 """
 Name of Service: Check Paper Trading Service Code
 Filename: check_paper_trading_service.py
-Version: 1.0.0
-Last Updated: 2025-06-25
+Version: 1.0.4
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.4 (2026-10-18) - try/except pairing uses pre-built line indexes
+v1.0.3 (2026-10-18) - Source read straight into a line list, no intermediate copy
+v1.0.2 (2026-10-18) - Lowercase each scanned line once per iteration
+v1.0.1 (2026-10-18) - Project file lookup goes through the shared _paths.find() resolver
 v1.0.0 (2025-06-25) - Analyze paper_trading.py for issues
   - Checks if dotenv is imported and used
   - Finds simulation fallback code
@@ -15,9 +19,11 @@ This script analyzes the paper_trading.py file to find why it's
 not using the working Alpaca credentials and falling back to simulation.
 """
 
-import os
+import bisect
 import re
 
+from _paths import find
+
 def check_paper_trading_code():
     """Analyze paper_trading.py for credential loading issues"""
     
@@ -26,12 +32,9 @@ def check_paper_trading_code():
     print("=" * 60)
     
     # Find paper_trading.py
-    paper_trading_path = None
-    if os.path.exists('../paper_trading.py'):
-        paper_trading_path = '../paper_trading.py'
-    elif os.path.exists('./paper_trading.py'):
-        paper_trading_path = './paper_trading.py'
-    else:
+    try:
+        paper_trading_path = find('paper_trading.py')
+    except FileNotFoundError:
         print("✗ Cannot find paper_trading.py")
         return
     
@@ -39,8 +42,7 @@ def check_paper_trading_code():
     print("=" * 60)
     
     with open(paper_trading_path, 'r') as f:
-        content = f.read()
-        lines = content.split('\n')
+        lines = f.read().splitlines()
     
     # 1. Check for dotenv import
     print("\n1. CHECKING FOR DOTENV USAGE:")
@@ -87,7 +89,8 @@ def check_paper_trading_code():
     
     simulation_found = False
     for i, line in enumerate(lines):
-        if 'simulation' in line.lower() or 'simulate' in line.lower():
+        ll = line.lower()
+        if 'simulation' in ll or 'simulate' in ll:
             if not simulation_found:
                 print("Found simulation code:")
                 simulation_found = True
@@ -97,22 +100,25 @@ def check_paper_trading_code():
     print("\n4. CHECKING ERROR HANDLING:")
     print("-" * 40)
     
-    in_try_block = False
-    try_line = 0
-    
-    for i, line in enumerate(lines):
-        if line.strip().startswith('try:'):
-            in_try_block = True
-            try_line = i
-        elif line.strip().startswith('except') and in_try_block:
-            # Check if this is near Alpaca code
-            block_text = '\n'.join(lines[try_line:i+5])
-            if 'alpaca' in block_text.lower() or 'api' in block_text.lower():
-                print(f"\nFound try/except around Alpaca code (lines {try_line+1}-{i+1}):")
-                print("  This might be catching errors and falling back to simulation")
-                for j in range(try_line, min(i+3, len(lines))):
-                    print(f"  Line {j+1}: {lines[j].rstrip()}")
-            in_try_block = False
+    # Index the try/except lines once, then pair each except with the
+    # closest try before it that no earlier except has claimed
+    try_idx = [i for i, line in enumerate(lines) if line.lstrip().startswith('try:')]
+    exc_idx = [i for i, line in enumerate(lines) if line.lstrip().startswith('except')]
+    
+    last_except = -1
+    for i in exc_idx:
+        k = bisect.bisect_left(try_idx, i) - 1
+        if k < 0 or try_idx[k] <= last_except:
+            continue
+        try_line = try_idx[k]
+        last_except = i
+        # Check if this is near Alpaca code
+        block_lower = '\n'.join(lines[try_line:i+5]).lower()
+        if 'alpaca' in block_lower or 'api' in block_lower:
+            print(f"\nFound try/except around Alpaca code (lines {try_line+1}-{i+1}):")
+            print("  This might be catching errors and falling back to simulation")
+            for j in range(try_line, min(i+3, len(lines))):
+                print(f"  Line {j+1}: {lines[j].rstrip()}")
     
     # 5. Check __init__ method
     print("\n5. CHECKING __init__ METHOD:")
@@ -2,9 +2,11 @@
 """
 Name of Service: Check Trades Table Structure
 Filename: check_trades_table.py
-Version: 1.0.0
-Last Updated: 2025-06-25
+Version: 1.0.2
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.2 (2026-10-18) - sqlite3.Row factory limited to the sample-row query
+v1.0.1 (2026-10-18) - Project file lookup goes through the shared _paths.find() resolver
 v1.0.0 (2025-06-25) - Simple trades table checker
   - Shows exact column names
   - Handles None values properly
@@ -16,10 +18,8 @@ and identify the correct column names.
 """
 
 import sqlite3
-import os
 
-# Handle running from Testing folder
-db_path = '../trading_system.db' if os.path.exists('../trading_system.db') else './trading_system.db'
+from _paths import find
 
 def check_trades_table():
     """Check trades table structure"""
@@ -27,8 +27,14 @@ def check_trades_table():
     print("TRADES TABLE STRUCTURE CHECK")
     print("=" * 60)
     
+    # Handle running from Testing folder
+    try:
+        db_path = find('trading_system.db')
+    except FileNotFoundError:
+        print("✗ Cannot find trading_system.db")
+        return
+    
     conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row  # This enables column access by name
     cursor = conn.cursor()
     
     try:
@@ -79,8 +85,11 @@ def check_trades_table():
             print("\n5. SAMPLE TRADE:")
             print("-" * 40)
             
-            cursor.execute("SELECT * FROM trades LIMIT 1")
-            row = cursor.fetchone()
+            # Only this query reads columns by name
+            row_cursor = conn.cursor()
+            row_cursor.row_factory = sqlite3.Row
+            row_cursor.execute("SELECT * FROM trades LIMIT 1")
+            row = row_cursor.fetchone()
             
             for col in column_names:
                 value = row[col]
@@ -4,6 +4,13 @@ Fix for adding schedule endpoints to coordination service
 Add this code to coordination_service.py in the _setup_routes method
 """
 
+# Add this to coordination_service.py __init__ so the proxy routes reuse
+# keep-alive connections to the scheduler instead of reconnecting per request:
+#
+#     self._scheduler = requests.Session()
+#     adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+#     self._scheduler.mount('http://', adapter)
+
 # Add these routes to coordination_service.py _setup_routes method:
 
 @self.app.route('/schedule/status', methods=['GET'])
@@ -11,7 +18,7 @@ def get_schedule_status():
     """Proxy schedule status to scheduler service"""
     try:
         # Forward to scheduler service
-        response = requests.get('http://localhost:5011/status', timeout=5)
+        response = self._scheduler.get('http://localhost:5011/status', timeout=5)
         if response.status_code == 200:
             return jsonify(response.json())
     except Exception as e:
@@ -28,7 +35,7 @@ def schedule_config():
     """Proxy schedule config to scheduler service"""
     if request.method == 'GET':
         try:
-            response = requests.get('http://localhost:5011/config', timeout=5)
+            response = self._scheduler.get('http://localhost:5011/config', timeout=5)
             if response.status_code == 200:
                 return jsonify(response.json())
         except Exception as e:
@@ -46,8 +53,8 @@ def schedule_config():
     else:  # POST
         try:
             # Forward config to scheduler
-            response = requests.post('http://localhost:5011/config', 
-                                   json=request.json, timeout=5)
+            response = self._scheduler.post('http://localhost:5011/config',
+                                         json=request.json, timeout=5)
             if response.status_code == 200:
                 return jsonify(response.json())
             else:
@@ -2,6 +2,22 @@
 # Add this to coordination_service.py to fix the sync issue
 # Replace or update the /schedule/status endpoint handler
 
+# Module-level helpers (requires `import functools`): the parsed config is
+# cached per (path, mtime) so polling only costs a stat() until the file changes
+
+@functools.lru_cache(maxsize=4)
+def _load_schedule_config(path, mtime_ns):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def load_schedule_config(path):
+    """Return the parsed schedule config, or None if the file does not exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _load_schedule_config(path, st.st_mtime_ns)
+
 @self.app.route('/schedule/status', methods=['GET'])
 def get_schedule_status():
     """Get trading schedule status - synchronized with config"""
@@ -9,10 +25,10 @@ def get_schedule_status():
     config_file = './schedule_config.json'
     
     try:
-        # Load config from file
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+        # Load config from file (copied, the cached dict must not be mutated)
+        cached = load_schedule_config(config_file)
+        if cached is not None:
+            config = dict(cached)
         else:
             # Use defaults
             config = {
@@ -9,113 +9,143 @@ Run this to patch common workflow problems
 import sqlite3
 import json
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 
-def fix_service_registration_table():
-    """Ensure service_coordination table exists and is accessible"""
-    print("🔧 Fixing service registration table...")
-    
-    try:
-        conn = sqlite3.connect('./trading_system.db')
-        cursor = conn.cursor()
-        
-        # Ensure service_coordination table exists
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS service_coordination (
-                service_name TEXT PRIMARY KEY,
-                host TEXT NOT NULL,
-                port INTEGER NOT NULL,
-                status TEXT NOT NULL,
-                last_heartbeat TIMESTAMP,
-                start_time TIMESTAMP,
-                metadata TEXT
-            )
-        ''')
-        
-        # Clear any stale registrations
-        cursor.execute("DELETE FROM service_coordination WHERE status = 'stopped'")
-        
-        # Update existing registrations to show they're running
-        cursor.execute("UPDATE service_coordination SET status = 'running', last_heartbeat = ?", 
-                      (datetime.now().isoformat(),))
-        
-        conn.commit()
-        conn.close()
-        
-        print("✅ Service registration table fixed")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error fixing service registration: {e}")
-        return False
+# Core services that should be registered
+CORE_SERVICES = [
+    {"service_name": "technical_analysis", "port": 5003},
+    {"service_name": "pattern_analysis", "port": 5002},
+    {"service_name": "security_scanner", "port": 5001},
+    {"service_name": "paper_trading", "port": 5005},
+    {"service_name": "web_dashboard", "port": 5010}
+]
+
+# Timestamp for every row this run writes, taken once at startup
+_RUN_TS = datetime.now().isoformat()
+
+# Shared keep-alive session for every HTTP probe in this script. Every target
+# is on localhost, so skip the per-request proxy/netrc environment lookups.
+SESSION = requests.Session()
+SESSION.trust_env = False
+SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
+
+# (connect, read) timeouts for liveness probes
+PROBE_TIMEOUT = (1, 2)
 
-def fix_workflow_tracking_tables():
-    """Ensure workflow tracking tables exist"""
-    print("🔧 Fixing workflow tracking tables...")
+# Tables and indexes the coordination service and workflow tracker expect,
+# keyed by their sqlite_master name. Tables come before their indexes.
+SCHEMA_DDL = {
+    'service_coordination': '''
+        CREATE TABLE IF NOT EXISTS service_coordination (
+            service_name TEXT PRIMARY KEY,
+            host TEXT NOT NULL,
+            port INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            last_heartbeat TIMESTAMP,
+            start_time TIMESTAMP,
+            metadata TEXT
+        )
+    ''',
+    'idx_svc_status': 'CREATE INDEX IF NOT EXISTS idx_svc_status ON service_coordination(status)',
+    'workflow_tracking': '''
+        CREATE TABLE IF NOT EXISTS workflow_tracking (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cycle_id TEXT NOT NULL,
+            phase TEXT NOT NULL,
+            status TEXT NOT NULL,
+            start_time TEXT,
+            end_time TEXT,
+            duration_seconds REAL,
+            items_processed INTEGER DEFAULT 0,
+            items_succeeded INTEGER DEFAULT 0,
+            items_failed INTEGER DEFAULT 0,
+            error_message TEXT,
+            retry_count INTEGER DEFAULT 0,
+            metadata TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''',
+    'idx_wt_cycle': 'CREATE INDEX IF NOT EXISTS idx_wt_cycle ON workflow_tracking(cycle_id)',
+    'workflow_events': '''
+        CREATE TABLE IF NOT EXISTS workflow_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cycle_id TEXT NOT NULL,
+            phase TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            event_data TEXT,
+            timestamp TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''',
+    'idx_we_cycle': 'CREATE INDEX IF NOT EXISTS idx_we_cycle ON workflow_events(cycle_id, timestamp)',
+    'workflow_metrics': '''
+        CREATE TABLE IF NOT EXISTS workflow_metrics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cycle_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            start_time TEXT NOT NULL,
+            end_time TEXT,
+            total_duration_seconds REAL,
+            securities_scanned INTEGER DEFAULT 0,
+            patterns_detected INTEGER DEFAULT 0,
+            signals_generated INTEGER DEFAULT 0,
+            trades_executed INTEGER DEFAULT 0,
+            success_rate REAL DEFAULT 0.0,
+            error_count INTEGER DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''',
+    'idx_wm_cycle': 'CREATE INDEX IF NOT EXISTS idx_wm_cycle ON workflow_metrics(cycle_id)'
+}
+
+def _open_db():
+    """Open the trading database in WAL mode with a busy timeout"""
+    conn = sqlite3.connect('./trading_system.db')
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA busy_timeout=5000')
+    return conn
+
+def fix_database_tables():
+    """Ensure service_coordination and workflow tracking tables exist
+    
+    Only DDL for tables and indexes missing from sqlite_master runs, as one
+    script sharing a single transaction with the registration cleanup.
+    """
+    print("🔧 Fixing service registration and workflow tracking tables...")
     
     try:
-        conn = sqlite3.connect('./trading_system.db')
-        cursor = conn.cursor()
-        
-        # Ensure workflow_tracking table exists
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workflow_tracking (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cycle_id TEXT NOT NULL,
-                phase TEXT NOT NULL,
-                status TEXT NOT NULL,
-                start_time TEXT,
-                end_time TEXT,
-                duration_seconds REAL,
-                items_processed INTEGER DEFAULT 0,
-                items_succeeded INTEGER DEFAULT 0,
-                items_failed INTEGER DEFAULT 0,
-                error_message TEXT,
-                retry_count INTEGER DEFAULT 0,
-                metadata TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Ensure workflow_events table exists
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workflow_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cycle_id TEXT NOT NULL,
-                phase TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                event_data TEXT,
-                timestamp TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Ensure workflow_metrics table exists
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workflow_metrics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cycle_id TEXT NOT NULL,
-                status TEXT NOT NULL,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
-                total_duration_seconds REAL,
-                securities_scanned INTEGER DEFAULT 0,
-                patterns_detected INTEGER DEFAULT 0,
-                signals_generated INTEGER DEFAULT 0,
-                trades_executed INTEGER DEFAULT 0,
-                success_rate REAL DEFAULT 0.0,
-                error_count INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        conn = _open_db()
+        try:
+            have = {row[0] for row in conn.execute(
+                f"SELECT name FROM sqlite_master WHERE name IN ({','.join('?' * len(SCHEMA_DDL))})",
+                tuple(SCHEMA_DDL))}
+            missing = [sql for name, sql in SCHEMA_DDL.items() if name not in have]
+            conn.executescript('BEGIN;' + ';'.join(missing))
+            
+            # Clear any stale registrations
+            conn.execute("DELETE FROM service_coordination WHERE status = 'stopped'")
+            
+            # Mark registrations running, leaving rows that already are (the
+            # coordinator's own 'active' included) with their real heartbeat
+            conn.execute("UPDATE service_coordination SET status = 'running', last_heartbeat = ? "
+                         "WHERE status NOT IN ('running', 'active') OR last_heartbeat IS NULL",
+                         (_RUN_TS,))
+            
+            conn.commit()
+            
+            # Refresh planner statistics after the schema changes
+            conn.execute('PRAGMA optimize')
+        finally:
+            conn.close()
         
+        print("✅ Service registration table fixed")
         print("✅ Workflow tracking tables fixed")
         return True
         
     except Exception as e:
-        print(f"❌ Error fixing workflow tables: {e}")
+        print(f"❌ Error fixing database tables: {e}")
         return False
 
 def test_coordination_endpoints():
@@ -124,9 +154,14 @@ def test_coordination_endpoints():
     
     base_url = "http://localhost:5000"
     
+    # Issue all three requests at once; results are reported in order below
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pending = {path: executor.submit(SESSION.get, f"{base_url}{path}", timeout=5)
+                   for path in ('/health', '/service_status', '/trading_cycles')}
+    
     # Test health endpoint
     try:
-        response = requests.get(f"{base_url}/health", timeout=5)
+        response = pending['/health'].result()
         if response.status_code == 200:
             print("✅ Health endpoint working")
         else:
@@ -136,7 +171,7 @@ def test_coordination_endpoints():
     
     # Test service status endpoint
     try:
-        response = requests.get(f"{base_url}/service_status", timeout=5)
+        response = pending['/service_status'].result()
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Service status endpoint working: {len(data.get('services', []))} services")
@@ -147,7 +182,7 @@ def test_coordination_endpoints():
     
     # Test trading cycles endpoint
     try:
-        response = requests.get(f"{base_url}/trading_cycles", timeout=5)
+        response = pending['/trading_cycles'].result()
         if response.status_code == 200:
             cycles = response.json()
             print(f"✅ Trading cycles endpoint working: {len(cycles)} cycles")
@@ -156,46 +191,103 @@ def test_coordination_endpoints():
     except Exception as e:
         print(f"❌ Trading cycles endpoint error: {e}")
 
+def _is_healthy(service, session):
+    """Check if a service is actually running"""
+    url = f"http://localhost:{service['port']}/health"
+    try:
+        # Status only, so skip the body; fall back to GET if HEAD is refused
+        health_response = session.head(url, timeout=PROBE_TIMEOUT)
+        if health_response.status_code == 405:
+            health_response = session.get(url, timeout=PROBE_TIMEOUT)
+        if health_response.status_code == 200:
+            return True
+        print(f"⚠️ {service['service_name']} not responding on port {service['port']}")
+    except Exception as e:
+        print(f"⚠️ Could not check {service['service_name']}: {e}")
+    return False
+
+def _registration_data(service):
+    return {
+        "service_name": service["service_name"],
+        "port": service["port"],
+        "status": "running"
+    }
+
+def _register(service, session, base_url):
+    """Register one service with the coordinator"""
+    try:
+        response = session.post(f"{base_url}/register_service",
+                                json=_registration_data(service), timeout=5)
+        
+        if response.status_code == 200:
+            print(f"✅ Registered {service['service_name']}")
+        else:
+            print(f"⚠️ Failed to register {service['service_name']}: {response.status_code}")
+            
+    except Exception as e:
+        print(f"⚠️ Could not register {service['service_name']}: {e}")
+
 def force_service_registration():
     """Force register core services if they're not showing up"""
     print("🔧 Force registering core services...")
     
     base_url = "http://localhost:5000"
     
-    # Core services that should be registered
-    services = [
-        {"service_name": "technical_analysis", "port": 5003},
-        {"service_name": "pattern_analysis", "port": 5002},
-        {"service_name": "security_scanner", "port": 5001},
-        {"service_name": "paper_trading", "port": 5005},
-        {"service_name": "web_dashboard", "port": 5010}
-    ]
-    
-    for service in services:
+    # Services with a fresh heartbeat are already registered. Heartbeats this
+    # run stamped itself in fix_database_tables say nothing about liveness.
+    # The coordinator stores datetimes with a space separator and this script
+    # uses 'T', so both sides are compared in the space-separated form.
+    cutoff = (datetime.now() - timedelta(seconds=60)).isoformat(sep=' ')
+    try:
+        conn = _open_db()
         try:
-            # Check if service is actually running
-            health_response = requests.get(f"http://localhost:{service['port']}/health", timeout=2)
-            
-            if health_response.status_code == 200:
-                # Service is running, register it
-                registration_data = {
-                    "service_name": service["service_name"],
-                    "port": service["port"],
-                    "status": "running"
-                }
-                
-                response = requests.post(f"{base_url}/register_service", 
-                                       json=registration_data, timeout=5)
-                
-                if response.status_code == 200:
-                    print(f"✅ Registered {service['service_name']}")
-                else:
-                    print(f"⚠️ Failed to register {service['service_name']}: {response.status_code}")
-            else:
-                print(f"⚠️ {service['service_name']} not responding on port {service['port']}")
-                
-        except Exception as e:
-            print(f"⚠️ Could not check/register {service['service_name']}: {e}")
+            already = {row[0] for row in conn.execute(
+                "SELECT service_name FROM service_coordination "
+                "WHERE status IN ('active', 'running') "
+                "AND replace(last_heartbeat, 'T', ' ') > ? AND last_heartbeat != ?",
+                (cutoff, _RUN_TS))}
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        already = set()
+    
+    services = []
+    for service in CORE_SERVICES:
+        if service['service_name'] in already:
+            print(f"✅ {service['service_name']} already registered")
+        else:
+            services.append(service)
+    
+    if not services:
+        return
+    
+    # Probes are independent, so run them side by side over the pooled session
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        results = list(executor.map(lambda service: _is_healthy(service, SESSION), services))
+    healthy = [service for service, ok in zip(services, results) if ok]
+    
+    if not healthy:
+        return
+    
+    # Register every running service in one request and one server-side transaction
+    try:
+        response = SESSION.post(f"{base_url}/register_services_bulk",
+                                json={"services": [_registration_data(s) for s in healthy]},
+                                timeout=5)
+        if response.status_code == 200:
+            for service in healthy:
+                print(f"✅ Registered {service['service_name']}")
+            return
+        if response.status_code != 404:
+            print(f"⚠️ Failed to register services: {response.status_code}")
+            return
+    except Exception as e:
+        print(f"⚠️ Could not register services: {e}")
+        return
+    
+    # Older coordinator without the bulk endpoint: register one at a time
+    with ThreadPoolExecutor(max_workers=len(healthy)) as executor:
+        list(executor.map(lambda service: _register(service, SESSION, base_url), healthy))
 
 def create_logs_directory():
     """Ensure logs directory exists"""
@@ -216,10 +308,13 @@ def create_logs_directory():
             'workflow_manager.log'
         ]
         
+        # One directory read instead of a stat per file
+        with os.scandir('./logs') as entries:
+            existing = {entry.name for entry in entries}
+        
         for log_file in log_files:
-            log_path = Path(f'./logs/{log_file}')
-            if not log_path.exists():
-                log_path.touch()
+            if log_file not in existing:
+                open(f'./logs/{log_file}', 'a').close()
                 print(f"✅ Created {log_file}")
         
         return True
@@ -233,22 +328,26 @@ def main():
     print("🚀 Coordination Service Workflow Fix")
     print("=" * 45)
     
-    # Run fixes in order
-    fixes = [
-        create_logs_directory,
-        fix_service_registration_table,
-        fix_workflow_tracking_tables,
-        test_coordination_endpoints,
-        force_service_registration
+    # Fixes within a stage are independent and run concurrently; each stage
+    # waits for the previous one
+    stages = [
+        [create_logs_directory, fix_database_tables],
+        # Endpoint checks and registration need the database fixes in place
+        [test_coordination_endpoints, force_service_registration]
     ]
     
-    for fix in fixes:
-        try:
-            fix()
-            print()
-        except Exception as e:
-            print(f"❌ Fix failed: {e}")
-            print()
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for stage in stages:
+                futures = {executor.submit(fix): fix for fix in stage}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"❌ Fix {futures[future].__name__} failed: {e}")
+                print()
+    finally:
+        SESSION.close()
     
     print("=" * 45)
     print("🔧 After running fixes:")
@@ -2,9 +2,37 @@
 """
 Name of Service: TRADING SYSTEM DATABASE MIGRATION
 Filename: database_migration_v106.py
-Version: 1.0.6
-Last Updated: 2025-06-26
+Version: 1.0.7
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.7 (2026-10-18) - Migration performance
+  - Schema created on one connection inside a single transaction
+  - Table DDL moved to the module-level SCHEMA_DDL script
+  - Indexes built after seeding, run_migration(defer_indexes=True) leaves them to the caller
+  - One autocommit connection opened on first use and shared by every step
+  - 8KB pages on new databases and a 256MB mmap_size
+  - PRAGMA optimize (with analysis_limit = 400) when the connection is closed
+  - Statements run through conn.execute() instead of one-shot cursors
+  - EXPECTED_TABLES frozenset built once at import time
+  - Backups taken with the sqlite3 online backup API from the shared connection
+  - Plain tuple rows, no sqlite3.Row wrapping
+  - Result cursors iterated directly rather than through fetchall()
+  - Indexes generated from the INDEXES table and run as one script
+  - journal_mode only switched to WAL when the file is not already in WAL
+  - One summary log line for the ensured directories
+  - Explicit BEGIN/COMMIT around the index and seed steps
+  - Backup timestamp formatted with time.strftime
+  - Per-table creation messages logged at DEBUG, summary stays at INFO
+  - Index DDL built once at import time
+  - Per-connection PRAGMAs sent as a single CONNECTION_PRAGMAS script
+  - First-open page_size and WAL switch sent as one script as well
+  - Tables, seed data and indexes committed in one outer transaction
+  - DatabaseMigration usable as a context manager that closes the connection
+  - get_schema_info() reads its PRAGMA settings in one SELECT
+  - verify_schema() lets SQLite compute the missing/extra table diff
+  - Column details for all tables gathered with one pragma_table_info() join
+  - Seed rows grouped per INSERT and written with executemany()
+  - Only indexes missing from sqlite_master are created
 v1.0.6 (2025-06-26) - Current directory path standardization and complete schema
   - Updated database path to ./trading_system.db  
   - Updated logs path to ./logs/
@@ -37,8 +65,8 @@ import sqlite3
 import logging
 import json
 import os
-import shutil
-from datetime import datetime
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
 # Project Root Configuration  
@@ -48,7 +76,397 @@ LOGS_PATH = './logs'
 BACKUPS_PATH = './backups'
 
 # Version constant for tracking
-VERSION = "1.0.6"
+VERSION = "1.0.7"
+
+# Complete table schema, run as one script by create_tables()
+SCHEMA_DDL = """
+-- Core Trading Tables
+
+-- Create trades table for executed trades and performance tracking
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol VARCHAR(10) NOT NULL,
+    signal_type VARCHAR(10) NOT NULL,
+    quantity INTEGER NOT NULL,
+    entry_price REAL NOT NULL,
+    exit_price REAL,
+    confidence REAL,
+    trade_reason TEXT,
+    alpaca_order_id VARCHAR(100),
+    status VARCHAR(20) DEFAULT 'pending',
+    profit_loss REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    closed_at TIMESTAMP,
+    strategy_name VARCHAR(50),
+    position_id INTEGER,
+    commission REAL DEFAULT 0.0,
+    FOREIGN KEY (position_id) REFERENCES positions(id)
+);
+
+-- Create orders table for order management and tracking
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id TEXT UNIQUE NOT NULL,
+    symbol TEXT NOT NULL,
+    order_type TEXT NOT NULL,
+    side TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    price REAL,
+    stop_price REAL,
+    status TEXT NOT NULL,
+    filled_quantity INTEGER DEFAULT 0,
+    average_fill_price REAL,
+    commission REAL,
+    strategy_name TEXT,
+    entry_reason TEXT,
+    exit_reason TEXT,
+    created_timestamp TIMESTAMP NOT NULL,
+    updated_timestamp TIMESTAMP,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create positions table for real-time position tracking
+CREATE TABLE IF NOT EXISTS positions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT UNIQUE NOT NULL,
+    quantity INTEGER NOT NULL,
+    average_cost REAL NOT NULL,
+    current_price REAL,
+    market_value REAL,
+    unrealized_pnl REAL,
+    realized_pnl REAL DEFAULT 0,
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create portfolio_status table for historical portfolio tracking
+CREATE TABLE IF NOT EXISTS portfolio_status (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TIMESTAMP NOT NULL,
+    total_value REAL NOT NULL,
+    cash_balance REAL NOT NULL,
+    positions_value REAL NOT NULL,
+    daily_pnl REAL,
+    total_pnl REAL,
+    margin_used REAL DEFAULT 0,
+    buying_power REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create balance_history table for cash flow tracking
+CREATE TABLE IF NOT EXISTS balance_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TIMESTAMP NOT NULL,
+    cash_balance REAL NOT NULL,
+    change_amount REAL NOT NULL,
+    change_reason TEXT,
+    transaction_type VARCHAR(20),
+    related_trade_id INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (related_trade_id) REFERENCES trades(id)
+);
+
+-- Create transactions table for detailed transaction history
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    transaction_id TEXT UNIQUE NOT NULL,
+    symbol TEXT,
+    transaction_type VARCHAR(20) NOT NULL,
+    quantity INTEGER,
+    price REAL,
+    amount REAL NOT NULL,
+    commission REAL DEFAULT 0,
+    description TEXT,
+    timestamp TIMESTAMP NOT NULL,
+    related_order_id TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (related_order_id) REFERENCES orders(order_id)
+);
+
+-- Analysis Tables
+
+-- Create scanning_results table for security scanner results
+CREATE TABLE IF NOT EXISTS scanning_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    scan_timestamp TIMESTAMP NOT NULL,
+    price REAL,
+    volume INTEGER,
+    change_percent REAL,
+    relative_volume REAL,
+    market_cap REAL,
+    scan_type TEXT,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create pattern_analysis table for technical patterns
+CREATE TABLE IF NOT EXISTS pattern_analysis (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    pattern_type TEXT NOT NULL,
+    pattern_name TEXT NOT NULL,
+    confidence REAL,
+    entry_price REAL,
+    stop_loss REAL,
+    target_price REAL,
+    timeframe TEXT,
+    detection_timestamp TIMESTAMP NOT NULL,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create technical_indicators table for calculated indicators
+CREATE TABLE IF NOT EXISTS technical_indicators (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    indicator_name TEXT NOT NULL,
+    indicator_value REAL,
+    signal TEXT,
+    timeframe TEXT,
+    calculation_timestamp TIMESTAMP NOT NULL,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create news_sentiment table for sentiment analysis
+CREATE TABLE IF NOT EXISTS news_sentiment (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    headline TEXT NOT NULL,
+    source TEXT,
+    article_date TIMESTAMP NOT NULL,
+    sentiment_score REAL,
+    sentiment_label TEXT,
+    relevance_score REAL,
+    impact_score REAL,
+    analysis_timestamp TIMESTAMP NOT NULL,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Machine Learning Tables
+
+-- Create ml_predictions table for machine learning predictions
+CREATE TABLE IF NOT EXISTS ml_predictions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    model_version TEXT,
+    prediction_type TEXT NOT NULL,
+    prediction_value REAL,
+    confidence REAL,
+    features_used TEXT,
+    prediction_timestamp TIMESTAMP NOT NULL,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create ml_models table for stored machine learning models
+CREATE TABLE IF NOT EXISTS ml_models (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    model_name TEXT UNIQUE NOT NULL,
+    model_version TEXT,
+    model_type TEXT,
+    model_data BLOB,
+    training_accuracy REAL,
+    validation_accuracy REAL,
+    feature_names TEXT,
+    hyperparameters TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Risk & Strategy Tables
+
+-- Create strategy_evaluations table for trading strategy evaluation
+CREATE TABLE IF NOT EXISTS strategy_evaluations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    strategy_name TEXT NOT NULL,
+    entry_signal TEXT,
+    entry_price REAL,
+    stop_loss REAL,
+    target_price REAL,
+    position_size INTEGER,
+    risk_reward_ratio REAL,
+    expected_return REAL,
+    confidence_score REAL,
+    evaluation_timestamp TIMESTAMP NOT NULL,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create risk_metrics table for portfolio risk calculations
+CREATE TABLE IF NOT EXISTS risk_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT,
+    portfolio_value REAL,
+    position_size REAL,
+    risk_amount REAL,
+    risk_percentage REAL,
+    max_positions INTEGER,
+    current_positions INTEGER,
+    daily_loss_limit REAL,
+    current_daily_loss REAL,
+    var_95 REAL,
+    sharpe_ratio REAL,
+    calculation_timestamp TIMESTAMP NOT NULL,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- System Management Tables
+
+-- Create service_coordination table for service registry
+CREATE TABLE IF NOT EXISTS service_coordination (
+    service_name TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    port INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    last_heartbeat TIMESTAMP,
+    start_time TIMESTAMP,
+    metadata TEXT
+);
+
+-- Create trading_cycles table for trading cycle tracking
+CREATE TABLE IF NOT EXISTS trading_cycles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cycle_id TEXT UNIQUE NOT NULL,
+    status TEXT NOT NULL,
+    start_time TIMESTAMP,
+    end_time TIMESTAMP,
+    securities_scanned INTEGER DEFAULT 0,
+    patterns_found INTEGER DEFAULT 0,
+    trades_executed INTEGER DEFAULT 0,
+    error_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create workflow_tracking table for detailed workflow phase tracking
+CREATE TABLE IF NOT EXISTS workflow_tracking (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cycle_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    status TEXT NOT NULL,
+    start_time TEXT,
+    end_time TEXT,
+    duration_seconds REAL,
+    items_processed INTEGER DEFAULT 0,
+    items_succeeded INTEGER DEFAULT 0,
+    items_failed INTEGER DEFAULT 0,
+    error_message TEXT,
+    retry_count INTEGER DEFAULT 0,
+    metadata TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create workflow_events table for workflow event logging
+CREATE TABLE IF NOT EXISTS workflow_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cycle_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_data TEXT,
+    timestamp TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create workflow_metrics table for aggregated workflow performance
+CREATE TABLE IF NOT EXISTS workflow_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cycle_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    total_duration_seconds REAL,
+    securities_scanned INTEGER DEFAULT 0,
+    patterns_detected INTEGER DEFAULT 0,
+    signals_generated INTEGER DEFAULT 0,
+    trades_executed INTEGER DEFAULT 0,
+    success_rate REAL DEFAULT 0.0,
+    error_count INTEGER DEFAULT 0,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create trading_schedule_config table for trading schedule configuration
+CREATE TABLE IF NOT EXISTS trading_schedule_config (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    config TEXT NOT NULL
+);
+"""
+
+# Table names in creation order
+TABLE_NAMES = (
+    'trades', 'orders', 'positions', 'portfolio_status', 'balance_history', 'transactions',
+    'scanning_results', 'pattern_analysis', 'technical_indicators', 'news_sentiment',
+    'ml_predictions', 'ml_models',
+    'strategy_evaluations', 'risk_metrics',
+    'service_coordination', 'trading_cycles', 'workflow_tracking', 'workflow_events', 'workflow_metrics', 'trading_schedule_config',
+)
+
+# Individual statements, so the schema can join an already open transaction
+# (executescript() always commits a pending transaction first)
+_SCHEMA_STATEMENTS = tuple(ddl for ddl in SCHEMA_DDL.split(';') if ddl.strip())
+
+# Per-connection PRAGMAs applied by get_connection()
+CONNECTION_PRAGMAS = """
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+PRAGMA mmap_size = 268435456;
+PRAGMA foreign_keys = ON;
+"""
+
+# Tables verify_schema() requires to be present
+EXPECTED_TABLES = frozenset(TABLE_NAMES)
+
+# Expected-vs-existing table diff computed by SQLite, so verify_schema()
+# only receives the differences tagged 'missing' or 'extra'
+_SCHEMA_DIFF_SQL = """
+    WITH expected(name) AS (VALUES {values}),
+         existing AS (SELECT name FROM sqlite_master
+                      WHERE type='table' AND name NOT LIKE 'sqlite_%')
+    SELECT 'missing', name FROM (SELECT name FROM expected EXCEPT SELECT name FROM existing)
+    UNION ALL
+    SELECT 'extra', name FROM (SELECT name FROM existing EXCEPT SELECT name FROM expected)
+    ORDER BY 1, 2
+""".format(values=", ".join("(?)" for _ in EXPECTED_TABLES))
+_SCHEMA_DIFF_PARAMS = tuple(sorted(EXPECTED_TABLES))
+
+# Performance indexes as (index name, table, column)
+INDEXES = (
+    # Symbol-based indexes
+    ('idx_scanning_symbol', 'scanning_results', 'symbol'),
+    ('idx_pattern_symbol', 'pattern_analysis', 'symbol'),
+    ('idx_technical_symbol', 'technical_indicators', 'symbol'),
+    ('idx_ml_symbol', 'ml_predictions', 'symbol'),
+    ('idx_strategy_symbol', 'strategy_evaluations', 'symbol'),
+    ('idx_orders_symbol', 'orders', 'symbol'),
+    ('idx_news_symbol', 'news_sentiment', 'symbol'),
+    ('idx_trades_symbol', 'trades', 'symbol'),
+    ('idx_positions_symbol', 'positions', 'symbol'),
+
+    # Time-based indexes
+    ('idx_scanning_timestamp', 'scanning_results', 'scan_timestamp'),
+    ('idx_pattern_timestamp', 'pattern_analysis', 'detection_timestamp'),
+    ('idx_risk_timestamp', 'risk_metrics', 'calculation_timestamp'),
+    ('idx_news_date', 'news_sentiment', 'article_date'),
+    ('idx_trades_created', 'trades', 'created_at'),
+    ('idx_portfolio_timestamp', 'portfolio_status', 'timestamp'),
+
+    # Lookup indexes
+    ('idx_technical_indicator', 'technical_indicators', 'indicator_name'),
+    ('idx_ml_model', 'ml_predictions', 'model_name'),
+    ('idx_strategy_name', 'strategy_evaluations', 'strategy_name'),
+    ('idx_orders_status', 'orders', 'status'),
+    ('idx_orders_order_id', 'orders', 'order_id'),
+    ('idx_trades_status', 'trades', 'status'),
+    ('idx_workflow_cycle', 'workflow_tracking', 'cycle_id'),
+)
+
+# Index DDL generated once at import
+_INDEX_DDL = tuple(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({column})"
+                   for name, table, column in INDEXES)
 
 # Configure logging for GitHub Codespaces
 def setup_logging():
@@ -75,6 +493,10 @@ class DatabaseMigration:
         self.tables_created = []
         self.indexes_created = []
         
+        # Single connection shared by every step, opened on first use so the
+        # backup check still sees whether the database file already existed
+        self._conn = None
+        
         # Ensure required directories exist
         self.ensure_directories()
         
@@ -84,42 +506,95 @@ class DatabaseMigration:
         
     def ensure_directories(self):
         """Create required directory structure in project root"""
-        required_dirs = [
-            LOGS_PATH,
-            BACKUPS_PATH,
-            './data',
-            './config'
-        ]
+        required_dirs = (LOGS_PATH, BACKUPS_PATH, './data', './config')
         
         for directory in required_dirs:
-            os.makedirs(directory, exist_ok=True)
-            logger.info(f"Ensured directory: {directory}")
+            Path(directory).mkdir(parents=True, exist_ok=True)
+        logger.info("Ensured directories: %s", ', '.join(required_dirs))
     
     def get_connection(self):
-        """Get database connection with optimized configuration"""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
-        conn.row_factory = sqlite3.Row
+        """Get the shared database connection, configuring it on first use"""
+        if self._conn is not None:
+            return self._conn
+        
+        # Autocommit mode: every step manages its own BEGIN/COMMIT
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
         
-        # Enable WAL mode for better concurrent access
-        conn.execute("PRAGMA journal_mode = WAL")
-        conn.execute("PRAGMA synchronous = NORMAL")
-        conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("PRAGMA temp_store = MEMORY")
+        # WAL mode is persistent in the database file, so only switch (and
+        # set the page size, which must precede WAL on a new database) when
+        # the file is not already in WAL mode
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        if mode != 'wal':
+            # Enable WAL mode for better concurrent access
+            conn.executescript("PRAGMA page_size = 8192; PRAGMA journal_mode = WAL;")
         
+        # Per-connection settings, applied in one script after WAL is on
+        conn.executescript(CONNECTION_PRAGMAS)
+        
+        self._conn = conn
         return conn
     
+    @contextmanager
+    def transaction(self):
+        """Run a block in a transaction on the shared connection
+        
+        Starts BEGIN IMMEDIATE ... COMMIT when no transaction is open. Inside
+        an outer transaction (run_migration) the block becomes a savepoint,
+        so a failing step can be undone without losing the earlier steps.
+        """
+        conn = self.get_connection()
+        if conn.in_transaction:
+            conn.execute("SAVEPOINT migration_step")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK TO migration_step")
+                conn.execute("RELEASE migration_step")
+                raise
+            conn.execute("RELEASE migration_step")
+        else:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
+    def close(self):
+        """Close the shared database connection"""
+        if self._conn is not None:
+            # Refresh planner statistics for the new indexes and data before
+            # the connection goes away; analysis_limit bounds the sampling
+            self._conn.execute("PRAGMA analysis_limit = 400")
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+            self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
     def backup_database(self):
         """Create timestamped backup of existing database"""
         if not os.path.exists(self.db_path):
             logger.info("No existing database to backup")
             return None
             
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
         backup_path = f'{BACKUPS_PATH}/trading_system_backup_{timestamp}.db'
         
         try:
-            shutil.copy2(self.db_path, backup_path)
+            # Online backup API: consistent snapshot that includes WAL content,
+            # taken from the shared connection the migration goes on to use
+            dst = sqlite3.connect(backup_path)
+            try:
+                with dst:
+                    self.get_connection().backup(dst, pages=1024)
+            finally:
+                dst.close()
             logger.info(f"Database backed up to: {backup_path}")
             return backup_path
         except Exception as e:
@@ -130,35 +605,14 @@ class DatabaseMigration:
         """Create all required database tables"""
         logger.info("Creating database tables...")
         
-        # Core Trading Tables
-        self.create_trades_table()
-        self.create_orders_table()
-        self.create_positions_table()
-        self.create_portfolio_status_table()
-        self.create_balance_history_table()
-        self.create_transactions_table()
-        
-        # Analysis Tables
-        self.create_scanning_results_table()
-        self.create_pattern_analysis_table()
-        self.create_technical_indicators_table()
-        self.create_news_sentiment_table()
-        
-        # Machine Learning Tables
-        self.create_ml_predictions_table()
-        self.create_ml_models_table()
-        
-        # Risk & Strategy Tables
-        self.create_strategy_evaluations_table()
-        self.create_risk_metrics_table()
+        # One connection and one transaction for the whole schema
+        with self.transaction() as conn:
+            for ddl in _SCHEMA_STATEMENTS:
+                conn.execute(ddl)
         
-        # System Management Tables
-        self.create_service_coordination_table()
-        self.create_trading_cycles_table()
-        self.create_workflow_tracking_table()
-        self.create_workflow_events_table()
-        self.create_workflow_metrics_table()
-        self.create_trading_schedule_config_table()
+        for table in TABLE_NAMES:
+            self.tables_created.append(table)
+            logger.debug(f"Created {table} table")
         
         logger.info(f"Created {len(self.tables_created)} tables")
     
@@ -166,582 +620,27 @@ class DatabaseMigration:
         """Create performance indexes"""
         logger.info("Creating database indexes...")
         
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        indexes = [
-            # Symbol-based indexes
-            "CREATE INDEX IF NOT EXISTS idx_scanning_symbol ON scanning_results(symbol)",
-            "CREATE INDEX IF NOT EXISTS idx_pattern_symbol ON pattern_analysis(symbol)",
-            "CREATE INDEX IF NOT EXISTS idx_technical_symbol ON technical_indicators(symbol)",
-            "CREATE INDEX IF NOT EXISTS idx_ml_symbol ON ml_predictions(symbol)",
-            "CREATE INDEX IF NOT EXISTS idx_strategy_symbol ON strategy_evaluations(symbol)",
-            "CREATE INDEX IF NOT EXISTS idx_orders_symbol ON orders(symbol)",
-            "CREATE INDEX IF NOT EXISTS idx_news_symbol ON news_sentiment(symbol)",
-            "CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)",
-            "CREATE INDEX IF NOT EXISTS idx_positions_symbol ON positions(symbol)",
-            
-            # Time-based indexes
-            "CREATE INDEX IF NOT EXISTS idx_scanning_timestamp ON scanning_results(scan_timestamp)",
-            "CREATE INDEX IF NOT EXISTS idx_pattern_timestamp ON pattern_analysis(detection_timestamp)",
-            "CREATE INDEX IF NOT EXISTS idx_risk_timestamp ON risk_metrics(calculation_timestamp)",
-            "CREATE INDEX IF NOT EXISTS idx_news_date ON news_sentiment(article_date)",
-            "CREATE INDEX IF NOT EXISTS idx_trades_created ON trades(created_at)",
-            "CREATE INDEX IF NOT EXISTS idx_portfolio_timestamp ON portfolio_status(timestamp)",
-            
-            # Lookup indexes
-            "CREATE INDEX IF NOT EXISTS idx_technical_indicator ON technical_indicators(indicator_name)",
-            "CREATE INDEX IF NOT EXISTS idx_ml_model ON ml_predictions(model_name)",
-            "CREATE INDEX IF NOT EXISTS idx_strategy_name ON strategy_evaluations(strategy_name)",
-            "CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)",
-            "CREATE INDEX IF NOT EXISTS idx_orders_order_id ON orders(order_id)",
-            "CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status)",
-            "CREATE INDEX IF NOT EXISTS idx_workflow_cycle ON workflow_tracking(cycle_id)"
-        ]
-        
-        for index_sql in indexes:
-            try:
-                cursor.execute(index_sql)
-                self.indexes_created.append(index_sql.split()[5])  # Extract index name
-            except Exception as e:
-                logger.error(f"Failed to create index: {e}")
+        try:
+            with self.transaction() as conn:
+                # Look up existing indexes once and only run DDL for the rest
+                existing = {row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index'")}
+                missing = [(name, ddl) for (name, _, _), ddl in zip(INDEXES, _INDEX_DDL)
+                           if name not in existing]
+                for _, ddl in missing:
+                    conn.execute(ddl)
+            self.indexes_created.extend(name for name, _ in missing)
+            if len(missing) < len(INDEXES):
+                logger.info(f"Skipped {len(INDEXES) - len(missing)} existing indexes")
+        except Exception as e:
+            logger.error(f"Failed to create indexes: {e}")
         
-        conn.commit()
-        conn.close()
         logger.info(f"Created {len(self.indexes_created)} indexes")
     
-    # Core Trading Tables
-    def create_trades_table(self):
-        """Create trades table for executed trades and performance tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol VARCHAR(10) NOT NULL,
-                signal_type VARCHAR(10) NOT NULL,
-                quantity INTEGER NOT NULL,
-                entry_price REAL NOT NULL,
-                exit_price REAL,
-                confidence REAL,
-                trade_reason TEXT,
-                alpaca_order_id VARCHAR(100),
-                status VARCHAR(20) DEFAULT 'pending',
-                profit_loss REAL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                closed_at TIMESTAMP,
-                strategy_name VARCHAR(50),
-                position_id INTEGER,
-                commission REAL DEFAULT 0.0,
-                FOREIGN KEY (position_id) REFERENCES positions(id)
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('trades')
-        logger.info("Created trades table")
-    
-    def create_orders_table(self):
-        """Create orders table for order management and tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS orders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                order_id TEXT UNIQUE NOT NULL,
-                symbol TEXT NOT NULL,
-                order_type TEXT NOT NULL,
-                side TEXT NOT NULL,
-                quantity INTEGER NOT NULL,
-                price REAL,
-                stop_price REAL,
-                status TEXT NOT NULL,
-                filled_quantity INTEGER DEFAULT 0,
-                average_fill_price REAL,
-                commission REAL,
-                strategy_name TEXT,
-                entry_reason TEXT,
-                exit_reason TEXT,
-                created_timestamp TIMESTAMP NOT NULL,
-                updated_timestamp TIMESTAMP,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('orders')
-        logger.info("Created orders table")
-    
-    def create_positions_table(self):
-        """Create positions table for real-time position tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS positions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT UNIQUE NOT NULL,
-                quantity INTEGER NOT NULL,
-                average_cost REAL NOT NULL,
-                current_price REAL,
-                market_value REAL,
-                unrealized_pnl REAL,
-                realized_pnl REAL DEFAULT 0,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('positions')
-        logger.info("Created positions table")
-    
-    def create_portfolio_status_table(self):
-        """Create portfolio_status table for historical portfolio tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS portfolio_status (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TIMESTAMP NOT NULL,
-                total_value REAL NOT NULL,
-                cash_balance REAL NOT NULL,
-                positions_value REAL NOT NULL,
-                daily_pnl REAL,
-                total_pnl REAL,
-                margin_used REAL DEFAULT 0,
-                buying_power REAL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('portfolio_status')
-        logger.info("Created portfolio_status table")
-    
-    def create_balance_history_table(self):
-        """Create balance_history table for cash flow tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS balance_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TIMESTAMP NOT NULL,
-                cash_balance REAL NOT NULL,
-                change_amount REAL NOT NULL,
-                change_reason TEXT,
-                transaction_type VARCHAR(20),
-                related_trade_id INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (related_trade_id) REFERENCES trades(id)
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('balance_history')
-        logger.info("Created balance_history table")
-    
-    def create_transactions_table(self):
-        """Create transactions table for detailed transaction history"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                transaction_id TEXT UNIQUE NOT NULL,
-                symbol TEXT,
-                transaction_type VARCHAR(20) NOT NULL,
-                quantity INTEGER,
-                price REAL,
-                amount REAL NOT NULL,
-                commission REAL DEFAULT 0,
-                description TEXT,
-                timestamp TIMESTAMP NOT NULL,
-                related_order_id TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (related_order_id) REFERENCES orders(order_id)
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('transactions')
-        logger.info("Created transactions table")
-    
-    def create_scanning_results_table(self):
-        """Create scanning_results table for security scanner results"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS scanning_results (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                scan_timestamp TIMESTAMP NOT NULL,
-                price REAL,
-                volume INTEGER,
-                change_percent REAL,
-                relative_volume REAL,
-                market_cap REAL,
-                scan_type TEXT,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('scanning_results')
-        logger.info("Created scanning_results table")
-    
-    def create_pattern_analysis_table(self):
-        """Create pattern_analysis table for technical patterns"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS pattern_analysis (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                pattern_type TEXT NOT NULL,
-                pattern_name TEXT NOT NULL,
-                confidence REAL,
-                entry_price REAL,
-                stop_loss REAL,
-                target_price REAL,
-                timeframe TEXT,
-                detection_timestamp TIMESTAMP NOT NULL,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('pattern_analysis')
-        logger.info("Created pattern_analysis table")
-    
-    def create_technical_indicators_table(self):
-        """Create technical_indicators table for calculated indicators"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS technical_indicators (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                indicator_name TEXT NOT NULL,
-                indicator_value REAL,
-                signal TEXT,
-                timeframe TEXT,
-                calculation_timestamp TIMESTAMP NOT NULL,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('technical_indicators')
-        logger.info("Created technical_indicators table")
-    
-    def create_news_sentiment_table(self):
-        """Create news_sentiment table for sentiment analysis"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS news_sentiment (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                headline TEXT NOT NULL,
-                source TEXT,
-                article_date TIMESTAMP NOT NULL,
-                sentiment_score REAL,
-                sentiment_label TEXT,
-                relevance_score REAL,
-                impact_score REAL,
-                analysis_timestamp TIMESTAMP NOT NULL,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('news_sentiment')
-        logger.info("Created news_sentiment table")
-    
-    def create_ml_predictions_table(self):
-        """Create ml_predictions table for machine learning predictions"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS ml_predictions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                model_name TEXT NOT NULL,
-                model_version TEXT,
-                prediction_type TEXT NOT NULL,
-                prediction_value REAL,
-                confidence REAL,
-                features_used TEXT,
-                prediction_timestamp TIMESTAMP NOT NULL,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('ml_predictions')
-        logger.info("Created ml_predictions table")
-    
-    def create_ml_models_table(self):
-        """Create ml_models table for stored machine learning models"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS ml_models (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                model_name TEXT UNIQUE NOT NULL,
-                model_version TEXT,
-                model_type TEXT,
-                model_data BLOB,
-                training_accuracy REAL,
-                validation_accuracy REAL,
-                feature_names TEXT,
-                hyperparameters TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('ml_models')
-        logger.info("Created ml_models table")
-    
-    def create_strategy_evaluations_table(self):
-        """Create strategy_evaluations table for trading strategy evaluation"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS strategy_evaluations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                strategy_name TEXT NOT NULL,
-                entry_signal TEXT,
-                entry_price REAL,
-                stop_loss REAL,
-                target_price REAL,
-                position_size INTEGER,
-                risk_reward_ratio REAL,
-                expected_return REAL,
-                confidence_score REAL,
-                evaluation_timestamp TIMESTAMP NOT NULL,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('strategy_evaluations')
-        logger.info("Created strategy_evaluations table")
-    
-    def create_risk_metrics_table(self):
-        """Create risk_metrics table for portfolio risk calculations"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS risk_metrics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT,
-                portfolio_value REAL,
-                position_size REAL,
-                risk_amount REAL,
-                risk_percentage REAL,
-                max_positions INTEGER,
-                current_positions INTEGER,
-                daily_loss_limit REAL,
-                current_daily_loss REAL,
-                var_95 REAL,
-                sharpe_ratio REAL,
-                calculation_timestamp TIMESTAMP NOT NULL,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('risk_metrics')
-        logger.info("Created risk_metrics table")
-    
-    def create_service_coordination_table(self):
-        """Create service_coordination table for service registry"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS service_coordination (
-                service_name TEXT PRIMARY KEY,
-                host TEXT NOT NULL,
-                port INTEGER NOT NULL,
-                status TEXT NOT NULL,
-                last_heartbeat TIMESTAMP,
-                start_time TIMESTAMP,
-                metadata TEXT
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('service_coordination')
-        logger.info("Created service_coordination table")
-    
-    def create_trading_cycles_table(self):
-        """Create trading_cycles table for trading cycle tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trading_cycles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cycle_id TEXT UNIQUE NOT NULL,
-                status TEXT NOT NULL,
-                start_time TIMESTAMP,
-                end_time TIMESTAMP,
-                securities_scanned INTEGER DEFAULT 0,
-                patterns_found INTEGER DEFAULT 0,
-                trades_executed INTEGER DEFAULT 0,
-                error_count INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('trading_cycles')
-        logger.info("Created trading_cycles table")
-    
-    def create_workflow_tracking_table(self):
-        """Create workflow_tracking table for detailed workflow phase tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workflow_tracking (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cycle_id TEXT NOT NULL,
-                phase TEXT NOT NULL,
-                status TEXT NOT NULL,
-                start_time TEXT,
-                end_time TEXT,
-                duration_seconds REAL,
-                items_processed INTEGER DEFAULT 0,
-                items_succeeded INTEGER DEFAULT 0,
-                items_failed INTEGER DEFAULT 0,
-                error_message TEXT,
-                retry_count INTEGER DEFAULT 0,
-                metadata TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('workflow_tracking')
-        logger.info("Created workflow_tracking table")
-    
-    def create_workflow_events_table(self):
-        """Create workflow_events table for workflow event logging"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workflow_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cycle_id TEXT NOT NULL,
-                phase TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                event_data TEXT,
-                timestamp TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('workflow_events')
-        logger.info("Created workflow_events table")
-    
-    def create_workflow_metrics_table(self):
-        """Create workflow_metrics table for aggregated workflow performance"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workflow_metrics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cycle_id TEXT NOT NULL,
-                status TEXT NOT NULL,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
-                total_duration_seconds REAL,
-                securities_scanned INTEGER DEFAULT 0,
-                patterns_detected INTEGER DEFAULT 0,
-                signals_generated INTEGER DEFAULT 0,
-                trades_executed INTEGER DEFAULT 0,
-                success_rate REAL DEFAULT 0.0,
-                error_count INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('workflow_metrics')
-        logger.info("Created workflow_metrics table")
-    
-    def create_trading_schedule_config_table(self):
-        """Create trading_schedule_config table for trading schedule configuration"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trading_schedule_config (
-                id INTEGER PRIMARY KEY CHECK (id = 1),
-                config TEXT NOT NULL
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.tables_created.append('trading_schedule_config')
-        logger.info("Created trading_schedule_config table")
-    
     def seed_initial_data(self):
         """Populate database with initial configuration data"""
         logger.info("Seeding initial data...")
         
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         # Initial trading schedule configuration
         initial_config = {
             "enabled": False,
@@ -755,42 +654,31 @@ class DatabaseMigration:
             "next_run": None
         }
         
-        cursor.execute('''
-            INSERT OR IGNORE INTO trading_schedule_config (id, config)
-            VALUES (1, ?)
-        ''', (json.dumps(initial_config),))
+        # Seed rows grouped per INSERT statement, one executemany() each
+        seed_rows = {
+            '''
+                INSERT OR IGNORE INTO trading_schedule_config (id, config)
+                VALUES (?, ?)
+            ''': [(1, json.dumps(initial_config))],
+        }
+        
+        with self.transaction() as conn:
+            for insert_sql, rows in seed_rows.items():
+                conn.executemany(insert_sql, rows)
         
-        conn.commit()
-        conn.close()
         logger.info("Initial data seeded")
     
     def verify_schema(self):
         """Verify all tables were created successfully"""
-        conn = None
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Get list of tables
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                ORDER BY name
-            """)
-            
-            existing_tables = [row[0] for row in cursor.fetchall()]
             
-            expected_tables = [
-                'balance_history', 'ml_models', 'ml_predictions', 'news_sentiment',
-                'orders', 'pattern_analysis', 'portfolio_status', 'positions',
-                'risk_metrics', 'scanning_results', 'service_coordination',
-                'strategy_evaluations', 'technical_indicators', 'trades',
-                'trading_cycles', 'trading_schedule_config', 'transactions',
-                'workflow_events', 'workflow_metrics', 'workflow_tracking'
-            ]
-            
-            missing_tables = set(expected_tables) - set(existing_tables)
-            extra_tables = set(existing_tables) - set(expected_tables)
+            # Compare expected and existing tables in SQL
+            diff = {'missing': [], 'extra': []}
+            for kind, name in conn.execute(_SCHEMA_DIFF_SQL, _SCHEMA_DIFF_PARAMS):
+                diff[kind].append(name)
+            missing_tables = set(diff['missing'])
+            extra_tables = set(diff['extra'])
             
             if missing_tables:
                 logger.error(f"Missing tables: {missing_tables}")
@@ -799,16 +687,17 @@ class DatabaseMigration:
             if extra_tables:
                 logger.warning(f"Extra tables found: {extra_tables}")
             
+            # Nothing is missing, so the existing tables are the expected
+            # ones plus any extras
+            existing_tables = EXPECTED_TABLES | extra_tables
             logger.info(f"Schema verification successful. Found {len(existing_tables)} tables.")
             logger.info(f"Tables: {', '.join(sorted(existing_tables))}")
             
             # Verify database configuration
-            cursor.execute("PRAGMA journal_mode")
-            journal_mode = cursor.fetchone()[0]
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
             logger.info(f"Journal mode: {journal_mode}")
             
-            cursor.execute("PRAGMA foreign_keys")
-            foreign_keys = cursor.fetchone()[0]
+            foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
             logger.info(f"Foreign keys: {'enabled' if foreign_keys else 'disabled'}")
             
             return True
@@ -816,14 +705,10 @@ class DatabaseMigration:
         except Exception as e:
             logger.error(f"Schema verification failed: {e}")
             return False
-        finally:
-            if conn:
-                conn.close()
     
     def get_schema_info(self):
         """Return detailed database schema information"""
         conn = self.get_connection()
-        cursor = conn.cursor()
         
         schema_info = {
             'database_path': self.db_path,
@@ -832,43 +717,46 @@ class DatabaseMigration:
             'configuration': {}
         }
         
-        # Get table information
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-        tables = [row[0] for row in cursor.fetchall()]
-        
-        for table in tables:
-            cursor.execute(f"PRAGMA table_info({table})")
-            columns = cursor.fetchall()
-            schema_info['tables'][table] = [
-                {
-                    'name': col[1],
-                    'type': col[2],
-                    'not_null': bool(col[3]),
-                    'default': col[4],
-                    'primary_key': bool(col[5])
-                }
-                for col in columns
-            ]
+        # Get table information, every table's columns in one statement
+        # by joining sqlite_master with pragma_table_info()
+        for table, name, col_type, not_null, default, pk in conn.execute("""
+            SELECT m.name, ti.name, ti.type, ti."notnull", ti.dflt_value, ti.pk
+            FROM sqlite_master m JOIN pragma_table_info(m.name) ti
+            WHERE m.type='table'
+            ORDER BY m.name, ti.cid
+        """):
+            schema_info['tables'].setdefault(table, []).append({
+                'name': name,
+                'type': col_type,
+                'not_null': bool(not_null),
+                'default': default,
+                'primary_key': bool(pk)
+            })
         
         # Get index information
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' ORDER BY name")
-        schema_info['indexes'] = [row[0] for row in cursor.fetchall()]
+        schema_info['indexes'] = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' ORDER BY name")]
         
-        # Get configuration
-        pragma_checks = [
+        # Get configuration, all settings read in one statement through the
+        # pragma table-valued functions
+        pragma_checks = (
             'journal_mode', 'synchronous', 'cache_size', 'foreign_keys', 'temp_store'
-        ]
+        )
         
-        for pragma in pragma_checks:
-            cursor.execute(f"PRAGMA {pragma}")
-            result = cursor.fetchone()
-            schema_info['configuration'][pragma] = result[0] if result else None
+        row = conn.execute(
+            "SELECT " + ", ".join(f"(SELECT * FROM pragma_{pragma})" for pragma in pragma_checks)
+        ).fetchone()
+        schema_info['configuration'] = dict(zip(pragma_checks, row))
         
-        conn.close()
         return schema_info
     
-    def run_migration(self):
-        """Execute complete migration process"""
+    def run_migration(self, defer_indexes=False):
+        """Execute complete migration process
+        
+        With defer_indexes=True the index step is skipped so a caller doing a
+        bulk import can load rows first and then call create_indexes() itself,
+        instead of paying per-row index maintenance during the import.
+        """
         logger.info(f"Starting Trading System Database Migration v{VERSION}")
         logger.info(f"Target: Current directory environment")
         logger.info(f"Database: {self.db_path}")
@@ -877,14 +765,19 @@ class DatabaseMigration:
             # Backup existing database
             backup_path = self.backup_database()
             
-            # Create tables
-            self.create_tables()
-            
-            # Create indexes
-            self.create_indexes()
-            
-            # Seed initial data
-            self.seed_initial_data()
+            # Schema, seed data and indexes commit together in one transaction
+            with self.transaction():
+                # Create tables
+                self.create_tables()
+                
+                # Seed initial data
+                self.seed_initial_data()
+                
+                # Create indexes once the rows are in
+                if defer_indexes:
+                    logger.info("Index creation deferred, call create_indexes() after loading data")
+                else:
+                    self.create_indexes()
             
             # Verify schema
             if not self.verify_schema():
@@ -907,30 +800,29 @@ class DatabaseMigration:
 def main():
     """Main function to run migration"""
     logger.info("=" * 60)
-    logger.info("TRADING SYSTEM DATABASE MIGRATION v1.0.6")
+    logger.info(f"TRADING SYSTEM DATABASE MIGRATION v{VERSION}")
     logger.info("Current Directory Edition")
     logger.info("=" * 60)
     
-    # Initialize migration
-    migration = DatabaseMigration()
-    
-    # Run migration
-    success = migration.run_migration()
-    
-    if success:
-        logger.info("Database migration completed successfully!")
-        logger.info(f"Database ready at: {DATABASE_PATH}")
-        logger.info(f"Logs available at: {LOGS_PATH}")
-        
-        # Display schema info
-        schema_info = migration.get_schema_info()
-        logger.info(f"Total tables: {len(schema_info['tables'])}")
-        logger.info(f"Total indexes: {len(schema_info['indexes'])}")
+    # Initialize migration; the shared connection is closed on exit
+    with DatabaseMigration() as migration:
+        # Run migration
+        success = migration.run_migration()
         
-        return 0
-    else:
-        logger.error("Database migration failed!")
-        return 1
+        if success:
+            logger.info("Database migration completed successfully!")
+            logger.info(f"Database ready at: {DATABASE_PATH}")
+            logger.info(f"Logs available at: {LOGS_PATH}")
+            
+            # Display schema info
+            schema_info = migration.get_schema_info()
+            logger.info(f"Total tables: {len(schema_info['tables'])}")
+            logger.info(f"Total indexes: {len(schema_info['indexes'])}")
+            
+            return 0
+        else:
+            logger.error("Database migration failed!")
+            return 1
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file
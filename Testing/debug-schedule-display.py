@@ -6,20 +6,33 @@ Checks what the APIs are actually returning vs what the HTML expects
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+BASE_URL = "http://localhost:5000"
+
+# One keep-alive session for every call below
+session = requests.Session()
+
 print("=" * 60)
 print("SCHEDULE DISPLAY DEBUG")
 print("=" * 60)
 
+# The status and config reads are independent, so start both up front;
+# .result() re-raises any request error inside the sections below
+pool = ThreadPoolExecutor(max_workers=2)
+status_future = pool.submit(session.get, f"{BASE_URL}/schedule/status")
+config_future = pool.submit(session.get, f"{BASE_URL}/schedule/config")
+pool.shutdown(wait=False)
+
 # 1. Check /schedule/status endpoint
 print("\n1. Checking /schedule/status endpoint:")
 print("-" * 40)
 try:
-    response = requests.get("http://localhost:5000/schedule/status")
+    response = status_future.result()
     print(f"Status Code: {response.status_code}")
     if response.status_code == 200:
-        data = response.json()
+        data = json.loads(response.content)
         print(f"Response: {json.dumps(data, indent=2)}")
         
         # Check what fields are present
@@ -27,7 +40,7 @@ try:
         for key in data.keys():
             print(f"  - {key}: {data[key]}")
     else:
-        print(f"Error: {response.text}")
+        print(f"Error: {response.content[:500].decode('utf-8', errors='replace')}")
 except Exception as e:
     print(f"Error: {e}")
 
@@ -35,10 +48,10 @@ except Exception as e:
 print("\n\n2. Checking /schedule/config endpoint:")
 print("-" * 40)
 try:
-    response = requests.get("http://localhost:5000/schedule/config")
+    response = config_future.result()
     print(f"Status Code: {response.status_code}")
     if response.status_code == 200:
-        data = response.json()
+        data = json.loads(response.content)
         print(f"Response: {json.dumps(data, indent=2)}")
         
         if data.get('enabled'):
@@ -46,7 +59,7 @@ try:
         else:
             print("\n❌ Schedule is DISABLED in config")
     else:
-        print(f"Error: {response.text}")
+        print(f"Error: {response.content[:500].decode('utf-8', errors='replace')}")
 except Exception as e:
     print(f"Error: {e}")
 
@@ -70,11 +83,11 @@ But your /schedule/status is returning:
 print("\n\n4. Testing schedule enable/disable:")
 print("-" * 40)
 
-# First get current config
+# First get current config (same read as section 2)
 try:
-    response = requests.get("http://localhost:5000/schedule/config")
+    response = config_future.result()
     if response.status_code == 200:
-        current_config = response.json()
+        current_config = json.loads(response.content)
         print(f"Current 'enabled' status: {current_config.get('enabled', False)}")
         
         # Try to enable it
@@ -83,17 +96,17 @@ try:
             new_config = current_config.copy()
             new_config['enabled'] = True
             
-            response = requests.post("http://localhost:5000/schedule/config", json=new_config)
+            response = session.post(f"{BASE_URL}/schedule/config", json=new_config)
             if response.status_code == 200:
                 print("✅ Successfully enabled schedule")
                 
                 # Check status again
-                response = requests.get("http://localhost:5000/schedule/status")
+                response = session.get(f"{BASE_URL}/schedule/status")
                 if response.status_code == 200:
-                    status = response.json()
+                    status = json.loads(response.content)
                     print(f"\nNew status: {json.dumps(status, indent=2)}")
             else:
-                print(f"❌ Failed to enable: {response.text}")
+                print(f"❌ Failed to enable: {response.content[:500].decode('utf-8', errors='replace')}")
 except Exception as e:
     print(f"Error: {e}")
 
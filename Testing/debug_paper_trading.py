@@ -2,9 +2,12 @@
 """
 Name of Service: Debug Paper Trading Credentials
 Filename: debug_paper_trading.py
-Version: 1.0.0
-Last Updated: 2025-06-25
+Version: 1.0.3
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.3 (2026-10-18) - paper_trading.py inspected through its syntax tree instead of text matching
+v1.0.2 (2026-10-18) - Project file lookup goes through the shared _paths.find() resolver
+v1.0.1 (2026-10-18) - paper_trading.py scanned in a single streaming pass
 v1.0.0 (2025-06-25) - Debug credential loading in paper trading
   - Checks if both API key and secret are loaded
   - Tests the actual connection
@@ -15,13 +18,21 @@ This script checks exactly what's happening with credential loading
 in the paper trading service and why it's falling back to simulation.
 """
 
+import ast
 import os
 import sys
 
+from _paths import find
+
 # Add parent directory to path
 if os.path.exists('../trading_system.db'):
     sys.path.insert(0, os.path.abspath('..'))
 
+def is_self_attr(node, names):
+    """True if node is a self.<name> attribute for one of the given names"""
+    return (isinstance(node, ast.Attribute) and node.attr in names
+            and isinstance(node.value, ast.Name) and node.value.id == 'self')
+
 def debug_paper_trading():
     """Debug the paper trading credential issue"""
     
@@ -33,18 +44,36 @@ def debug_paper_trading():
     print("\n1. CHECKING PAPER_TRADING.PY FOR API_SECRET:")
     print("-" * 40)
     
-    paper_trading_path = '../paper_trading.py' if os.path.exists('../paper_trading.py') else 'paper_trading.py'
+    paper_trading_path = find('paper_trading.py')
     
     with open(paper_trading_path, 'r') as f:
-        content = f.read()
-        lines = content.split('\n')
+        source = f.read()
+    try:
+        tree = ast.parse(source, filename=paper_trading_path)
+    except SyntaxError as e:
+        print(f"✗ Cannot parse {paper_trading_path}: {e}")
+        return
+    lines = source.splitlines()
+    
+    # One walk over the syntax tree collects everything the sections below
+    # report: self.api_secret references (and whether it is ever assigned)
+    # and the first __init__ / setup_alpaca_api definitions
+    secret_refs = set()
+    api_secret_found = False
+    functions = {}
+    for node in ast.walk(tree):
+        if is_self_attr(node, ('api_secret',)):
+            secret_refs.add(node.lineno)
+            if isinstance(node.ctx, ast.Store):
+                api_secret_found = True
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name in ('__init__', 'setup_alpaca_api'):
+            # ast.walk is breadth-first, keep the earliest definition in the file
+            if node.name not in functions or node.lineno < functions[node.name].lineno:
+                functions[node.name] = node
     
     # Look for api_secret
-    api_secret_found = False
-    for i, line in enumerate(lines):
-        if 'api_secret' in line and 'self.' in line:
-            print(f"Line {i+1}: {line.strip()}")
-            api_secret_found = True
+    for lineno in sorted(secret_refs):
+        print(f"Line {lineno}: {lines[lineno-1].strip()}")
     
     if not api_secret_found:
         print("✗ No self.api_secret assignment found!")
@@ -54,29 +83,24 @@ def debug_paper_trading():
     print("\n2. CHECKING __init__ METHOD:")
     print("-" * 40)
     
-    in_init = False
-    init_lines = []
-    for i, line in enumerate(lines):
-        if 'def __init__' in line:
-            in_init = True
-        elif in_init and line.strip() and not line.startswith(' ') and not line.startswith('\t'):
-            break
-        
-        if in_init:
-            init_lines.append(f"Line {i+1}: {line.rstrip()}")
-    
-    # Show relevant lines
-    for line in init_lines[:20]:  # First 20 lines of __init__
-        if any(keyword in line for keyword in ['api', 'key', 'secret', 'environ', 'ALPACA']):
-            print(line)
+    # Show relevant lines from the first 20 lines of __init__
+    init = functions.get('__init__')
+    if init:
+        for lineno in range(init.lineno, min(init.end_lineno, init.lineno + 19) + 1):
+            line = f"Line {lineno}: {lines[lineno-1].rstrip()}"
+            if any(keyword in line for keyword in ['api', 'key', 'secret', 'environ', 'ALPACA']):
+                print(line)
     
     # 3. Test loading credentials directly
     print("\n3. TESTING CREDENTIAL LOADING:")
     print("-" * 40)
     
-    # Load .env
+    # Load .env (a missing file leaves the environment as it is)
     from dotenv import load_dotenv
-    load_dotenv('../.env' if os.path.exists('../.env') else '.env')
+    try:
+        load_dotenv(find('.env'))
+    except FileNotFoundError:
+        pass
     
     api_key = os.environ.get('ALPACA_PAPER_API_KEY', '')
     api_secret = os.environ.get('ALPACA_PAPER_API_SECRET', '')
@@ -123,17 +147,14 @@ def debug_paper_trading():
     print("\n5. SETUP_ALPACA_API METHOD:")
     print("-" * 40)
     
-    # Find setup_alpaca_api method
-    in_setup = False
-    for i, line in enumerate(lines):
-        if 'def setup_alpaca_api' in line:
-            in_setup = True
-            print(f"Found at line {i+1}")
-            # Show next 30 lines
-            for j in range(i, min(i+30, len(lines))):
-                if 'self.api_key' in lines[j] or 'self.api_secret' in lines[j]:
-                    print(f"Line {j+1}: {lines[j].strip()}")
-            break
+    # Credential attributes used anywhere in setup_alpaca_api
+    setup = functions.get('setup_alpaca_api')
+    if setup:
+        print(f"Found at line {setup.lineno}")
+        cred_lines = {node.lineno for node in ast.walk(setup)
+                      if is_self_attr(node, ('api_key', 'api_secret'))}
+        for lineno in sorted(cred_lines):
+            print(f"Line {lineno}: {lines[lineno-1].strip()}")
     
     print("\n" + "=" * 60)
     print("DIAGNOSIS:")
@@ -2,9 +2,14 @@
 """
 Name of Service: Debug Trade Execution
 Filename: debug_trade_execution.py
-Version: 1.0.0
-Last Updated: 2025-06-25
+Version: 1.0.5
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.5 (2026-10-18) - The three request-format tests are sent concurrently on one session
+v1.0.4 (2026-10-18) - Project file lookup goes through the shared _paths.find() resolver
+v1.0.3 (2026-10-18) - Test 1 response body decoded once and parsed from that text
+v1.0.2 (2026-10-18) - Log tail filtered as bytes, only matching lines are decoded
+v1.0.1 (2026-10-18) - Log tail read from the end of the file instead of loading all of it
 v1.0.0 (2025-06-25) - Debug why trades aren't executing
   - Checks execute_trades endpoint logic
   - Identifies why empty array is returned
@@ -18,6 +23,25 @@ aren't being executed. This script finds out why.
 import requests
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from _paths import find
+
+# Trade-related log lines, matched on the raw bytes
+TRADE_RE = re.compile(rb'execute|trade', re.IGNORECASE)
+
+def read_tail(path, max_lines=50, max_bytes=65536):
+    """Return the last max_lines lines of a file as bytes, reading at most max_bytes from its end"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - max_bytes))
+        data = f.read()
+    lines = data.splitlines()
+    if size > max_bytes:
+        lines = lines[1:]  # first line was cut by the seek
+    return lines[-max_lines:]
 
 def debug_trade_execution():
     """Debug why trades aren't being executed"""
@@ -30,7 +54,7 @@ def debug_trade_execution():
     print("\n1. CHECKING EXECUTE_TRADES METHOD:")
     print("-" * 40)
     
-    paper_trading_path = '../paper_trading.py' if os.path.exists('../paper_trading.py') else 'paper_trading.py'
+    paper_trading_path = find('paper_trading.py')
     
     with open(paper_trading_path, 'r') as f:
         lines = f.readlines()
@@ -75,7 +99,6 @@ def debug_trade_execution():
     base_url = "http://localhost:5005"
     
     # Test 1: Current format
-    print("\nTest 1: Standard format with 'signals' key")
     test_payload = {
         "signals": [{
             "symbol": "AAPL",
@@ -86,13 +109,41 @@ def debug_trade_execution():
         }]
     }
     
+    # Test 2: Without 'signals' wrapper
+    test_payload2 = [{
+        "symbol": "MSFT",
+        "signal_type": "BUY",
+        "quantity": 1,
+        "confidence": 0.8,
+        "reason": "Debug test 2"
+    }]
+    
+    # Test 3: Single signal
+    test_payload3 = {
+        "symbol": "TSLA",
+        "signal_type": "BUY",
+        "quantity": 1,
+        "confidence": 0.8,
+        "reason": "Debug test 3"
+    }
+    
+    # The three tests are independent: send them together over one pooled
+    # session and report the results in order; .result() re-raises any
+    # request error inside each test's try block
+    session = requests.Session()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(session.post, f"{base_url}/execute_trades", json=payload, timeout=10)
+                   for payload in (test_payload, test_payload2, test_payload3)]
+    
+    print("\nTest 1: Standard format with 'signals' key")
     try:
-        response = requests.post(f"{base_url}/execute_trades", json=test_payload, timeout=10)
+        response = futures[0].result()
+        body = response.text  # decoded once, printed and then parsed
         print(f"Status: {response.status_code}")
-        print(f"Response: {response.text}")
+        print(f"Response: {body}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = json.loads(body)
             if isinstance(data, list) and len(data) == 0:
                 print("⚠️  Empty list returned - no trades executed")
             elif isinstance(data, dict):
@@ -101,54 +152,37 @@ def debug_trade_execution():
     except Exception as e:
         print(f"Error: {e}")
     
-    # Test 2: Without 'signals' wrapper
     print("\n\nTest 2: Direct array format")
-    test_payload2 = [{
-        "symbol": "MSFT",
-        "signal_type": "BUY",
-        "quantity": 1,
-        "confidence": 0.8,
-        "reason": "Debug test 2"
-    }]
-    
     try:
-        response = requests.post(f"{base_url}/execute_trades", json=test_payload2, timeout=10)
+        response = futures[1].result()
         print(f"Status: {response.status_code}")
         print(f"Response: {response.text[:200]}...")
     except Exception as e:
         print(f"Error: {e}")
     
-    # Test 3: Single signal
     print("\n\nTest 3: Single signal object")
-    test_payload3 = {
-        "symbol": "TSLA",
-        "signal_type": "BUY",
-        "quantity": 1,
-        "confidence": 0.8,
-        "reason": "Debug test 3"
-    }
-    
     try:
-        response = requests.post(f"{base_url}/execute_trades", json=test_payload3, timeout=10)
+        response = futures[2].result()
         print(f"Status: {response.status_code}")
         print(f"Response: {response.text[:200]}...")
     except Exception as e:
         print(f"Error: {e}")
     
+    session.close()
+    
     # 3. Check logs for errors
     print("\n\n3. CHECKING RECENT LOG ENTRIES:")
     print("-" * 40)
     
-    log_path = '../logs/paper_trading_service.log'
-    if os.path.exists(log_path):
-        with open(log_path, 'r') as f:
-            lines = f.readlines()
-            
-        # Look for recent execute_trades entries
-        recent_executes = []
-        for line in lines[-50:]:  # Last 50 lines
-            if 'execute' in line.lower() or 'trade' in line.lower():
-                recent_executes.append(line.strip())
+    try:
+        log_path = find(os.path.join('logs', 'paper_trading_service.log'))
+    except FileNotFoundError:
+        log_path = None
+    
+    if log_path:
+        # Look for recent execute_trades entries in the last 50 lines
+        recent_executes = [line.decode('utf-8', errors='replace').strip()
+                           for line in read_tail(log_path, 50) if TRADE_RE.search(line)]
         
         if recent_executes:
             print("Recent trade-related log entries:")
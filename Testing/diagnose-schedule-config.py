@@ -2,9 +2,18 @@
 """
 Name of Service: Schedule Configuration Diagnostic
 Filename: diagnose_schedule_config.py
-Version: 1.0.0
-Last Updated: 2025-01-27
+Version: 1.0.9
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.9 (2026-10-18) - Coordination fix written as a Flask blueprint module to register, not paste
+v1.0.8 (2026-10-18) - Saved schedule config verified from the POST response, no follow-up GET
+v1.0.7 (2026-10-18) - Report output buffered and flushed once per section
+v1.0.6 (2026-10-18) - Coordination fix routes moved to _fixtures/coordination_schedule_fix.py.tpl
+v1.0.5 (2026-10-18) - Endpoint GETs cached for a short TTL, POSTs invalidate their URL
+v1.0.4 (2026-10-18) - Endpoint GETs for each section are sent together ahead of the report
+v1.0.3 (2026-10-18) - Health probe checks the port with a raw TCP connect before the HTTP GET
+v1.0.2 (2026-10-18) - Service health probes run concurrently
+v1.0.1 (2026-10-18) - All probes share one keep-alive requests.Session
 v1.0.0 (2025-01-27) - Diagnose and fix schedule configuration issues
 
 DESCRIPTION:
@@ -12,14 +21,69 @@ This script diagnoses why the schedule configuration is failing
 and provides solutions or fixes.
 """
 
+import atexit
 import requests
 import json
+import shutil
+import socket
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from requests.adapters import HTTPAdapter
 
-def check_service_health(service_name, port):
-    """Check if a service is running and healthy"""
+# Blueprint module written out by create_coordination_fix()
+FIX_TEMPLATE = Path(__file__).parent / '_fixtures' / 'schedule_proxy_blueprint.py.tpl'
+
+# One pooled session for every probe so repeated requests to the same
+# service reuse their keep-alive connection
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+atexit.register(SESSION.close)
+
+# GET results keyed by URL: (time sent, future), reused for CACHE_TTL seconds
+CACHE_TTL = 10
+_POOL = ThreadPoolExecutor(max_workers=4)
+_CACHE = {}
+
+def prefetch(*urls):
+    """Start GETs for the given URLs in the background"""
+    for url in urls:
+        _CACHE[url] = (time.monotonic(), _POOL.submit(SESSION.get, url, timeout=5))
+
+def get(url, ttl=CACHE_TTL):
+    """GET url on the shared session, reusing a prefetched or recent response"""
+    hit = _CACHE.get(url)
+    if hit is None or time.monotonic() - hit[0] >= ttl:
+        prefetch(url)
+        hit = _CACHE[url]
+    # .result() re-raises a failed request just like a direct call would;
+    # failures are not kept so the next call tries again
+    try:
+        return hit[1].result()
+    except Exception:
+        _CACHE.pop(url, None)
+        raise
+
+def post(url, **kwargs):
+    """POST on the shared session, dropping any cached GET of the same URL"""
+    _CACHE.pop(url, None)
+    return SESSION.post(url, timeout=5, **kwargs)
+
+def probe_health(port):
+    """GET /health on a local port, failing fast if nothing is listening"""
+    # A closed port is refused immediately (or times out after 0.2s) without
+    # paying for an HTTP round trip; 127.0.0.1 skips the localhost lookup
+    with socket.socket() as s:
+        s.settimeout(0.2)
+        if s.connect_ex(("127.0.0.1", port)) != 0:
+            raise requests.exceptions.ConnectionError(f"port {port} is closed")
+    return SESSION.get(f"http://127.0.0.1:{port}/health", timeout=2)
+
+def check_service_health(service_name, port, pending=None):
+    """Check if a service is running and healthy, optionally using an in-flight probe future"""
     try:
-        response = requests.get(f"http://localhost:{port}/health", timeout=2)
+        response = pending.result() if pending else probe_health(port)
         if response.status_code == 200:
             print(f"✓ {service_name} is running on port {port}")
             return True
@@ -40,7 +104,7 @@ def test_schedule_endpoints():
     
     # Test GET /schedule/status on coordination service
     try:
-        response = requests.get("http://localhost:5000/schedule/status", timeout=5)
+        response = get("http://localhost:5000/schedule/status")
         print(f"GET /schedule/status: Status {response.status_code}")
         if response.status_code == 200:
             print(f"Response: {response.json()}")
@@ -51,7 +115,7 @@ def test_schedule_endpoints():
     
     # Test GET /schedule/config on coordination service
     try:
-        response = requests.get("http://localhost:5000/schedule/config", timeout=5)
+        response = get("http://localhost:5000/schedule/config")
         print(f"\nGET /schedule/config: Status {response.status_code}")
         if response.status_code == 200:
             print(f"Response: {response.json()}")
@@ -70,12 +134,22 @@ def test_schedule_endpoints():
     }
     
     try:
-        response = requests.post("http://localhost:5000/schedule/config", 
-                               json=test_config, timeout=5)
+        response = post("http://localhost:5000/schedule/config", json=test_config)
         print(f"\nPOST /schedule/config: Status {response.status_code}")
         if response.status_code == 200:
             print(f"✓ Schedule config saved successfully")
-            print(f"Response: {response.json()}")
+            data = response.json()
+            print(f"Response: {data}")
+            
+            # The coordination service echoes the stored config back
+            # ({"message", "config"}), so it can be verified without
+            # another round trip
+            saved = data.get('config', data) if isinstance(data, dict) else {}
+            mismatched = [key for key, value in test_config.items() if saved.get(key) != value]
+            if mismatched:
+                print(f"✗ Saved config differs from what was sent: {mismatched}")
+            else:
+                print("✓ Saved config matches what was sent")
         else:
             print(f"✗ Schedule config POST failed with status {response.status_code}")
             if response.text:
@@ -90,7 +164,7 @@ def check_scheduler_integration():
     
     # Check if scheduler is registered with coordination
     try:
-        response = requests.get("http://localhost:5000/service_status", timeout=5)
+        response = get("http://localhost:5000/service_status")
         if response.status_code == 200:
             services = response.json()
             if 'scheduler' in services:
@@ -103,14 +177,13 @@ def check_scheduler_integration():
                 # Try to register scheduler
                 print("\nAttempting to register scheduler...")
                 try:
-                    reg_response = requests.post(
+                    reg_response = post(
                         "http://localhost:5000/register_service",
                         json={
                             "service_name": "scheduler",
                             "port": 5011,
                             "endpoints": ["/health", "/start", "/stop", "/status", "/config"]
-                        },
-                        timeout=5
+                        }
                     )
                     if reg_response.status_code == 200:
                         print("✓ Successfully registered scheduler")
@@ -130,7 +203,7 @@ def test_scheduler_directly():
     
     # Test scheduler config endpoint directly
     try:
-        response = requests.get("http://localhost:5011/config", timeout=5)
+        response = get("http://localhost:5011/config")
         print(f"GET scheduler /config: Status {response.status_code}")
         if response.status_code == 200:
             print(f"✓ Scheduler config accessible")
@@ -142,7 +215,7 @@ def test_scheduler_directly():
     
     # Test scheduler status
     try:
-        response = requests.get("http://localhost:5011/status", timeout=5)
+        response = get("http://localhost:5011/status")
         print(f"\nGET scheduler /status: Status {response.status_code}")
         if response.status_code == 200:
             print(f"✓ Scheduler status: {response.json()}")
@@ -185,74 +258,21 @@ def create_coordination_fix():
     print("\n6. Creating Coordination Service Fix:")
     print("-" * 40)
     
-    fix_code = '''#!/usr/bin/env python3
-"""
-Fix for adding schedule endpoints to coordination service
-Add this code to coordination_service.py in the _setup_routes method
-"""
-
-# Add these routes to coordination_service.py _setup_routes method:
-
-@self.app.route('/schedule/status', methods=['GET'])
-def get_schedule_status():
-    """Proxy schedule status to scheduler service"""
-    try:
-        # Forward to scheduler service
-        response = requests.get('http://localhost:5011/status', timeout=5)
-        if response.status_code == 200:
-            return jsonify(response.json())
-    except Exception as e:
-        self.logger.error(f"Error getting schedule status: {e}")
+    # The blueprint module is kept as a template file next to this script
+    shutil.copyfile(FIX_TEMPLATE, 'schedule_proxy_blueprint.py')
     
-    return jsonify({
-        "enabled": False,
-        "message": "Scheduler service not available",
-        "next_run": None
-    })
-
-@self.app.route('/schedule/config', methods=['GET', 'POST'])
-def schedule_config():
-    """Proxy schedule config to scheduler service"""
-    if request.method == 'GET':
-        try:
-            response = requests.get('http://localhost:5011/config', timeout=5)
-            if response.status_code == 200:
-                return jsonify(response.json())
-        except Exception as e:
-            self.logger.error(f"Error getting schedule config: {e}")
-        
-        # Default config if scheduler not available
-        return jsonify({
-            "enabled": False,
-            "interval_minutes": 30,
-            "market_hours_only": True,
-            "start_time": "09:30",
-            "end_time": "16:00"
-        })
-    
-    else:  # POST
-        try:
-            # Forward config to scheduler
-            response = requests.post('http://localhost:5011/config', 
-                                   json=request.json, timeout=5)
-            if response.status_code == 200:
-                return jsonify(response.json())
-            else:
-                return jsonify({"error": "Failed to update scheduler config"}), 500
-        except Exception as e:
-            self.logger.error(f"Error updating schedule config: {e}")
-            return jsonify({"error": str(e)}), 500
-'''
-    
-    with open('coordination_schedule_fix.py', 'w') as f:
-        f.write(fix_code)
-    
-    print("✓ Created coordination_schedule_fix.py")
-    print("  This file contains the code to add to coordination_service.py")
-    print("  Add these routes to the _setup_routes method")
+    print("✓ Created schedule_proxy_blueprint.py")
+    print("  This module adds the schedule proxy routes as a Flask blueprint")
+    print("  Register it in coordination_service.py _setup_routes:")
+    print("    from schedule_proxy_blueprint import bp")
+    print("    self.app.register_blueprint(bp)")
 
 def main():
     """Run the diagnostic"""
+    # Even on a terminal, buffer the report and flush it once per section
+    # rather than once per printed line
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("=" * 60)
     print("SCHEDULE CONFIGURATION DIAGNOSTIC")
     print("=" * 60)
@@ -261,21 +281,35 @@ def main():
     print("\n1. Checking Service Health:")
     print("-" * 40)
     
-    coord_running = check_service_health("Coordination Service", 5000)
-    scheduler_running = check_service_health("Trading Scheduler", 5011)
-    dashboard_running = check_service_health("Web Dashboard", 5010)
+    # The probes are independent, so send them together and a dead port only
+    # costs one timeout; results are then reported in order
+    targets = [("Coordination Service", 5000), ("Trading Scheduler", 5011), ("Web Dashboard", 5010)]
+    with ThreadPoolExecutor(max_workers=len(targets)) as ex:
+        pending = [ex.submit(probe_health, port) for _, port in targets]
+    coord_running, scheduler_running, dashboard_running = (
+        check_service_health(name, port, future) for (name, port), future in zip(targets, pending))
+    sys.stdout.flush()
     
     # 2. Test endpoints
     if coord_running:
+        # The read-only coordination GETs go out together; the config POST
+        # is still sent after the GET /schedule/config result is reported
+        prefetch("http://localhost:5000/schedule/status",
+                 "http://localhost:5000/schedule/config",
+                 "http://localhost:5000/service_status")
         test_schedule_endpoints()
+    sys.stdout.flush()
     
     # 3. Check integration
     if coord_running:
         check_scheduler_integration()
+    sys.stdout.flush()
     
     # 4. Test scheduler directly
     if scheduler_running:
+        prefetch("http://localhost:5011/config", "http://localhost:5011/status")
         test_scheduler_directly()
+    sys.stdout.flush()
     
     # 5. Suggest fixes
     suggest_fixes()
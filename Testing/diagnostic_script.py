@@ -4,13 +4,27 @@ Technical Analysis Service Diagnostic Script
 Checks common issues and provides troubleshooting guidance
 """
 
+import argparse
 import sys
 import os
-import sqlite3
-import importlib
-import subprocess
+import atexit
+import functools
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+# One pooled session for every probe so repeated requests to the same
+# service reuse their keep-alive connection
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+atexit.register(SESSION.close)
+
+@functools.lru_cache(maxsize=None)
+def fs_stats(path='.'):
+    """statvfs of the working directory, shared by the permission and disk checks"""
+    return os.statvfs(path)
 
 def check_python_dependencies():
     """Check if required Python packages are available"""
@@ -23,12 +37,13 @@ def check_python_dependencies():
     missing_packages = []
     available_packages = []
     
+    # find_spec only locates each package on the import path; importing
+    # numpy/pandas/sklearn just to see that they exist takes seconds
     for package in required_packages:
-        try:
-            importlib.import_module(package.replace('-', '_'))
+        if find_spec(package.replace('-', '_')) is not None:
             available_packages.append(package)
             print(f"  ✅ {package}")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"  ❌ {package} - MISSING")
     
@@ -46,61 +61,69 @@ def check_database_setup():
     
     db_paths = [
         './trading_system.db',
-        '/workspaces/trading-system/trading_system.db',
-        './trading_system.db'
+        '/workspaces/trading-system/trading_system.db'
     ]
     
-    db_found = False
-    db_path = None
+    db_path = next((path for path in db_paths if os.path.isfile(path)), None)
     
-    for path in db_paths:
-        if os.path.exists(path):
-            db_found = True
-            db_path = path
-            print(f"  ✅ Database found: {path}")
-            break
-    
-    if not db_found:
+    if db_path:
+        print(f"  ✅ Database found: {db_path}")
+    else:
         print("  ❌ Database file not found")
         print("  💡 Run database migration first:")
         print("     python database_migration.py")
         return False, None
     
-    # Check database schema
+    # Check database schema (sqlite3 is only loaded once there is a database to open)
+    import sqlite3
     try:
-        conn = sqlite3.connect(db_path, timeout=10)
-        cursor = conn.cursor()
+        # Autocommit: the read-only checks below never open a transaction
+        conn = sqlite3.connect(db_path, timeout=10, isolation_level=None)
         
-        # Check if technical_indicators table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name='technical_indicators'
-        """)
+        # schema_version is bumped by every DDL statement, so a version that
+        # already passed the table check is not scanned again
+        schema_version, journal_mode = conn.execute("""
+            SELECT (SELECT schema_version FROM pragma_schema_version),
+                   (SELECT journal_mode FROM pragma_journal_mode)
+        """).fetchone()
+        cache_file = Path(db_path + '.diag_cache')
         
-        if cursor.fetchone():
-            print("  ✅ technical_indicators table exists")
-            
-            # Check table structure
-            cursor.execute("PRAGMA table_info(technical_indicators)")
-            columns = [row[1] for row in cursor.fetchall()]
-            expected_columns = [
-                'id', 'symbol', 'indicator_name', 'indicator_value', 
-                'signal', 'timeframe', 'calculation_timestamp', 
-                'metadata', 'created_at'
-            ]
-            
-            missing_columns = [col for col in expected_columns if col not in columns]
-            if missing_columns:
-                print(f"  ⚠️  Missing columns: {missing_columns}")
-            else:
-                print("  ✅ Table schema is correct")
+        if cache_file.is_file() and cache_file.read_text().strip() == str(schema_version):
+            print("  ✅ Schema unchanged since last successful check")
         else:
-            print("  ❌ technical_indicators table missing")
-            print("  💡 Run database migration to create tables")
+            # Table presence and its columns in one query
+            table, columns_csv = conn.execute("""
+                SELECT (SELECT name FROM sqlite_master
+                        WHERE type='table' AND name='technical_indicators'),
+                       (SELECT group_concat(name) FROM pragma_table_info('technical_indicators'))
+            """).fetchone()
             
+            # Check if technical_indicators table exists
+            if table:
+                print("  ✅ technical_indicators table exists")
+                
+                # Check table structure
+                columns = set(columns_csv.split(','))
+                expected_columns = [
+                    'id', 'symbol', 'indicator_name', 'indicator_value', 
+                    'signal', 'timeframe', 'calculation_timestamp', 
+                    'metadata', 'created_at'
+                ]
+                
+                missing_columns = [col for col in expected_columns if col not in columns]
+                if missing_columns:
+                    print(f"  ⚠️  Missing columns: {missing_columns}")
+                else:
+                    print("  ✅ Table schema is correct")
+                    try:
+                        cache_file.write_text(str(schema_version))
+                    except OSError:
+                        pass  # read-only location, check again next run
+            else:
+                print("  ❌ technical_indicators table missing")
+                print("  💡 Run database migration to create tables")
+        
         # Check WAL mode
-        cursor.execute("PRAGMA journal_mode")
-        journal_mode = cursor.fetchone()[0]
         print(f"  📊 Journal mode: {journal_mode}")
         
         conn.close()
@@ -110,13 +133,13 @@ def check_database_setup():
         print(f"  ❌ Database connection error: {e}")
         return False, db_path
 
-def check_port_availability():
-    """Check if port 5003 is available"""
+def check_port_availability(pending=None):
+    """Check if port 5003 is available, optionally using an in-flight probe future"""
     print("\n🔍 Checking Port Availability...")
     
     try:
         # Try to connect to port 5003
-        response = requests.get("http://localhost:5003/health", timeout=2)
+        response = pending.result() if pending else SESSION.get("http://localhost:5003/health", timeout=2)
         print(f"  ⚠️  Port 5003 already in use (status: {response.status_code})")
         print("  💡 Stop existing service or use different port")
         return False
@@ -127,12 +150,12 @@ def check_port_availability():
         print(f"  ❓ Port check inconclusive: {e}")
         return True
 
-def check_coordination_service():
-    """Check if coordination service is running"""
+def check_coordination_service(pending=None):
+    """Check if coordination service is running, optionally using an in-flight probe future"""
     print("\n🔍 Checking Coordination Service...")
     
     try:
-        response = requests.get("http://localhost:5000/health", timeout=2)
+        response = pending.result() if pending else SESSION.get("http://localhost:5000/health", timeout=2)
         if response.status_code == 200:
             print("  ✅ Coordination service is running")
             return True
@@ -152,24 +175,32 @@ def check_file_permissions():
     """Check file and directory permissions"""
     print("\n🔍 Checking File Permissions...")
     
+    # A read-only filesystem fails every write check below, report it once
+    if fs_stats().f_flag & os.ST_RDONLY:
+        print("  ❌ Current directory is on a read-only filesystem")
+        return False
+    
     # Check if logs directory exists and is writable
     logs_dir = Path('./logs')
-    if not logs_dir.exists():
-        try:
-            logs_dir.mkdir(exist_ok=True)
-            print("  ✅ Created logs directory")
-        except Exception as e:
-            print(f"  ❌ Cannot create logs directory: {e}")
-            return False
+    try:
+        logs_dir.mkdir()
+        print("  ✅ Created logs directory")
+    except FileExistsError:
+        pass
+    except Exception as e:
+        print(f"  ❌ Cannot create logs directory: {e}")
+        return False
     
-    if os.access(logs_dir, os.W_OK):
+    # Check against the effective uid (what matters under sudo) where supported
+    effective = os.access in os.supports_effective_ids
+    if os.access(logs_dir, os.W_OK, effective_ids=effective):
         print("  ✅ Logs directory is writable")
     else:
         print("  ❌ Logs directory is not writable")
         return False
     
     # Check current directory permissions
-    if os.access('.', os.W_OK):
+    if os.access('.', os.W_OK, effective_ids=effective):
         print("  ✅ Current directory is writable")
     else:
         print("  ❌ Current directory is not writable")
@@ -177,14 +208,23 @@ def check_file_permissions():
     
     return True
 
-def test_import_technical_analysis():
-    """Try to import the technical analysis service"""
+def test_import_technical_analysis(full=False):
+    """Check the technical analysis service can be found, and with full=True import and instantiate it"""
     print("\n🔍 Testing Service Import...")
     
     try:
         # Add current directory to path
         sys.path.insert(0, '.')
         
+        # Locating the module is enough by default; importing it sets up
+        # the Flask app and database, which takes a second or two
+        if find_spec('technical_analysis_v105') is None:
+            print("  ❌ Import failed: No module named 'technical_analysis_v105'")
+            return False
+        if not full:
+            print("  ✅ Service module found (use --full to import and instantiate it)")
+            return True
+        
         # Try to import the service
         from technical_analysis_v105 import TechnicalAnalysisService
         print("  ✅ Service imports successfully")
@@ -211,8 +251,8 @@ def check_system_resources():
     
     # Check available disk space
     try:
-        disk_usage = os.statvfs('.')
-        free_space = disk_usage.f_frsize * disk_usage.f_availf
+        disk_usage = fs_stats()
+        free_space = disk_usage.f_frsize * disk_usage.f_bavail
         free_gb = free_space / (1024**3)
         print(f"  📊 Available disk space: {free_gb:.2f} GB")
         
@@ -227,8 +267,21 @@ def check_system_resources():
     
     return True
 
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Technical Analysis Service Diagnostics')
+    parser.add_argument('--full', action='store_true',
+                       help='Import and instantiate the service instead of only locating it')
+    return parser.parse_args()
+
 def main():
     """Run all diagnostic checks"""
+    args = parse_arguments()
+    
+    # Even on a terminal, buffer the report and flush it once per check
+    # rather than once per printed line
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("🚀 Technical Analysis Service Diagnostics")
     print("=" * 50)
     
@@ -242,12 +295,23 @@ def main():
         check_database_setup,
         check_port_availability,
         check_coordination_service,
-        test_import_technical_analysis
+        functools.partial(test_import_technical_analysis, full=args.full)
     ]
     
+    # The network probes don't depend on the local checks: start them now so
+    # they are in flight while the dependency/disk/database checks run. Each
+    # check still prints its own section in order, and .result() re-raises
+    # any request error inside that check's handlers
+    pool = ThreadPoolExecutor(max_workers=2)
+    probes = {
+        check_port_availability: pool.submit(SESSION.get, "http://localhost:5003/health", timeout=2),
+        check_coordination_service: pool.submit(SESSION.get, "http://localhost:5000/health", timeout=2),
+    }
+    pool.shutdown(wait=False)
+    
     for check in checks:
         try:
-            result = check()
+            result = check(probes[check]) if check in probes else check()
             if isinstance(result, tuple):
                 result = result[0]  # For database check
             if not result:
@@ -255,6 +319,7 @@ def main():
         except Exception as e:
             print(f"  ❌ Check failed with error: {e}")
             all_checks_passed = False
+        sys.stdout.flush()
     
     print("\n" + "=" * 50)
     if all_checks_passed:
@@ -2,9 +2,17 @@
 """
 Name of Service: Find Trade Filter Issue
 Filename: find_trade_filter.py
-Version: 1.0.0
-Last Updated: 2025-06-25
+Version: 1.0.8
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.8 (2026-10-18) - Source that fails to parse skips only the _execute_trades section
+v1.0.7 (2026-10-18) - Every validation pattern checked on each candidate line, several checks on one line all reported
+v1.0.6 (2026-10-18) - Signal fields extracted with one bytes findall, method found without a full tree walk
+v1.0.5 (2026-10-18) - Alpaca check skipped when neither literal appears in the source
+v1.0.4 (2026-10-18) - Validation patterns searched in one pass as a named-group alternation
+v1.0.3 (2026-10-18) - Project file lookup goes through the shared _paths.find() resolver
+v1.0.2 (2026-10-18) - Source memory-mapped, match line numbers found by bisecting newline offsets
+v1.0.1 (2026-10-18) - _execute_trades and signal field accesses located through the syntax tree
 v1.0.0 (2025-06-25) - Find why trades are filtered out
   - Examines _execute_trades method logic
   - Identifies filtering conditions
@@ -15,9 +23,55 @@ The paper trading service receives signals but executes 0 trades.
 This script finds what conditions are filtering out the trades.
 """
 
-import os
+import ast
+import bisect
+import mmap
 import re
 
+from _paths import find
+
+# Validation-style code worth reporting (bytes, for the mmapped source)
+VALIDATION_PATTERNS = {name: re.compile(pattern, re.IGNORECASE) for name, pattern in (
+    ('validate_def', rb'def.*validate.*signal'),
+    ('check_def', rb'def.*check.*signal'),
+    ('filter_def', rb'def.*filter.*signal'),
+    ('signal_type', rb'if.*signal.*type.*in'),
+    ('confidence', rb'if.*confidence.*[<>=]'),
+    ('quantity', rb'if.*quantity.*[<>=]')
+)}
+
+# Any of the above, used only to find candidate lines in one pass. None of
+# the patterns cross a newline, so each candidate line is then searched with
+# every pattern: the greedy .* of the first hit cannot hide a later check
+VALIDATION_RE = re.compile(b'|'.join(p.pattern for p in VALIDATION_PATTERNS.values()), re.IGNORECASE)
+
+ALPACA_CHECK_RE = re.compile(rb'if.*ALPACA_AVAILABLE|if.*self\.alpaca_api')
+
+# signal['field'] / signal.get('field'); one findall returns every field
+FIELD_RE = re.compile(rb"""\bsignal\s*(?:\[\s*['"](\w+)['"]\s*\]|\.get\s*\(\s*['"](\w+)['"])""")
+
+def find_validation_checks(buf):
+    """(offset, pattern name, matched bytes) for every validation pattern hit in buf"""
+    hits = []
+    pos = 0
+    while (candidate := VALIDATION_RE.search(buf, pos)):
+        start = buf.rfind(b'\n', 0, candidate.start()) + 1
+        end = buf.find(b'\n', candidate.end())
+        if end == -1:
+            end = len(buf)
+        for name, pattern in VALIDATION_PATTERNS.items():
+            hits.extend((match.start(), name, match.group()) for match in pattern.finditer(buf, start, end))
+        pos = end + 1
+    return hits
+
+def find_method(tree, name):
+    """First function with the given name at module level or directly in a class"""
+    for node in tree.body:
+        for child in (node.body if isinstance(node, ast.ClassDef) else (node,)):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)) and child.name == name:
+                return child
+    return None
+
 def find_trade_filter():
     """Find why trades are being filtered out"""
     
@@ -25,42 +79,44 @@ def find_trade_filter():
     print("FINDING TRADE FILTER ISSUE")
     print("=" * 60)
     
-    paper_trading_path = '../paper_trading.py' if os.path.exists('../paper_trading.py') else 'paper_trading.py'
+    paper_trading_path = find('paper_trading.py')
+    
+    with open(paper_trading_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     
-    with open(paper_trading_path, 'r') as f:
-        content = f.read()
-        lines = content.split('\n')
+    # Newline offsets, found once: a match offset maps to its line number by
+    # bisection instead of counting newlines in the text before every match
+    newlines = [m.start() for m in re.finditer(rb'\n', mm)]
+    line_count = len(newlines) + 1
+    
+    def line_of(offset):
+        return bisect.bisect_left(newlines, offset) + 1
+    
+    def line_text(line_num):
+        start = newlines[line_num - 2] + 1 if line_num > 1 else 0
+        end = newlines[line_num - 1] if line_num <= len(newlines) else len(mm)
+        return mm[start:end].decode('utf-8', errors='replace')
+    
+    # A file that does not parse still gets the text-based sections below
+    try:
+        tree = ast.parse(mm[:], filename=paper_trading_path)
+    except SyntaxError as e:
+        tree = None
+        parse_error = e
     
     # 1. Find _execute_trades method
     print("\n1. ANALYZING _execute_trades METHOD:")
     print("-" * 40)
     
-    execute_trades_start = None
-    for i, line in enumerate(lines):
-        if 'def _execute_trades' in line:
-            execute_trades_start = i
-            print(f"Found _execute_trades at line {i+1}")
-            break
-    
-    if execute_trades_start:
-        # Extract the method (up to next def or class)
-        method_lines = []
-        indent_level = None
-        
-        for i in range(execute_trades_start, len(lines)):
-            line = lines[i]
-            
-            # Get initial indent level
-            if indent_level is None and line.strip() and not line.strip().startswith('def'):
-                indent_level = len(line) - len(line.lstrip())
-            
-            # Stop at next method/class or dedent
-            if i > execute_trades_start and line.strip():
-                current_indent = len(line) - len(line.lstrip())
-                if current_indent < indent_level or (current_indent == 0 and line.strip()):
-                    break
-            
-            method_lines.append((i+1, line))
+    if tree is None:
+        print(f"✗ Cannot parse {paper_trading_path}: {parse_error}")
+        method = None
+    else:
+        method = find_method(tree, '_execute_trades')
+    
+    if method:
+        print(f"Found _execute_trades at line {method.lineno}")
+        method_lines = [(n, line_text(n)) for n in range(method.lineno, method.end_lineno + 1)]
         
         # Analyze the method
         print("\nMethod code analysis:")
@@ -87,34 +143,15 @@ def find_trade_filter():
     print("\n\n2. CHECKING FOR VALIDATION FUNCTIONS:")
     print("-" * 40)
     
-    validation_patterns = [
-        r'def.*validate.*signal',
-        r'def.*check.*signal',
-        r'def.*filter.*signal',
-        r'if.*signal.*type.*in',
-        r'if.*confidence.*[<>=]',
-        r'if.*quantity.*[<>=]'
-    ]
-    
-    for pattern in validation_patterns:
-        matches = re.finditer(pattern, content, re.IGNORECASE)
-        for match in matches:
-            line_num = content[:match.start()].count('\n') + 1
-            print(f"Line {line_num}: {match.group()}")
+    for offset, name, text in find_validation_checks(mm):
+        print(f"Line {line_of(offset)} [{name}]: {text.decode('utf-8', errors='replace')}")
     
     # 3. Check for required fields
     print("\n\n3. CHECKING SIGNAL FIELD REQUIREMENTS:")
     print("-" * 40)
     
     # Find what fields are accessed from signals
-    signal_accesses = re.finditer(r'signal\s*\[\s*[\'"](\w+)[\'"]\s*\]|signal\.get\s*\(\s*[\'"](\w+)[\'"]', content)
-    
-    required_fields = set()
-    for match in signal_accesses:
-        field = match.group(1) or match.group(2)
-        if field:
-            required_fields.add(field)
-    
+    required_fields = {(key or getter).decode() for key, getter in FIELD_RE.findall(mm)}
     print("Fields accessed from signals:")
     for field in sorted(required_fields):
         print(f"  - {field}")
@@ -123,19 +160,27 @@ def find_trade_filter():
     print("\n\n4. CHECKING FOR ALPACA_AVAILABLE:")
     print("-" * 40)
     
-    alpaca_checks = re.finditer(r'if.*ALPACA_AVAILABLE|if.*self\.alpaca_api', content)
+    # Both alternatives need one of these literals; a plain find rules the
+    # whole section out without running the regex over the file
+    if mm.find(b'ALPACA_AVAILABLE') == -1 and mm.find(b'self.alpaca_api') == -1:
+        alpaca_checks = ()
+        print("No Alpaca references found")
+    else:
+        alpaca_checks = ALPACA_CHECK_RE.finditer(mm)
     for match in alpaca_checks:
-        line_num = content[:match.start()].count('\n') + 1
-        line_content = lines[line_num - 1].strip()
+        line_num = line_of(match.start())
+        line_content = line_text(line_num).strip()
         print(f"Line {line_num}: {line_content}")
         
         # Check what happens if false
-        if line_num < len(lines) - 5:
+        if line_num < line_count - 5:
             for i in range(1, 6):
-                next_line = lines[line_num - 1 + i].strip()
+                next_line = line_text(line_num + i).strip()
                 if 'simulate' in next_line.lower() or 'return' in next_line:
                     print(f"  Line {line_num + i}: {next_line}")
     
+    mm.close()
+    
     # 5. Test signal format
     print("\n\n5. REQUIRED SIGNAL FORMAT:")
     print("-" * 40)
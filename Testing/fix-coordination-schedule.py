@@ -2,9 +2,16 @@
 """
 Name of Service: Fix Coordination Schedule Endpoints
 Filename: fix_coordination_schedule_endpoints.py
-Version: 1.0.0
-Last Updated: 2025-01-27
+Version: 1.0.5
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.5 (2026-10-18) - Already-patched and marker-less files detected with plain substring checks
+  - Verification pattern compiled once at import, service path lookup cached
+v1.0.4 (2026-10-18) - Routes and helpers spliced into the file text at offsets, no line list
+v1.0.3 (2026-10-18) - Backup made with _backup.clone_file() (reflink where the filesystem supports it)
+v1.0.2 (2026-10-18) - verify_changes finds every marker in one pass over the raw bytes
+v1.0.1 (2026-10-18) - Insertion point located with compiled multiline regexes instead of nested line scans
+  - Escaped {interval} in the generated status route, which raised NameError
 v1.0.0 (2025-01-27) - Add missing schedule endpoints to coordination service
 
 DESCRIPTION:
@@ -12,18 +19,39 @@ This script adds the missing schedule configuration endpoints to the
 coordination service by modifying the file directly.
 """
 
+import functools
 import os
 import re
-import shutil
 from datetime import datetime
 
+from _backup import clone_file
+
+# Markers used to place the new routes inside _setup_routes
+_RE_SETUP = re.compile(r'def _setup_routes\(self\):')
+_RE_DEF = re.compile(r'^[ \t]*def (?!health)', re.M)
+_RE_ROUTE = re.compile(r'^([ \t]*).*@self\.app\.route', re.M)
+# Unindented lines; the last one marks where the class ends
+_RE_TOP_LEVEL = re.compile(r'^\S', re.M)
+
+# Markers that must all be present after patching, found with one scan
+_VERIFY_CHECKS = [
+    ('/schedule/status', "schedule/status endpoint"),
+    ('/schedule/config', "schedule/config endpoint"),
+    ('_get_schedule_config', "_get_schedule_config method"),
+    ('_save_schedule_config', "_save_schedule_config method"),
+    ('_start_scheduler', "_start_scheduler method"),
+    ('_stop_scheduler', "_stop_scheduler method")
+]
+_VERIFY_RE = re.compile(b'|'.join(re.escape(check_str.encode()) for check_str, _ in _VERIFY_CHECKS))
+
 def backup_file(filepath):
     """Create a backup of the original file"""
     backup_path = f"{filepath}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    shutil.copy2(filepath, backup_path)
+    clone_file(filepath, backup_path)
     print(f"✓ Created backup: {backup_path}")
     return backup_path
 
+@functools.lru_cache(maxsize=1)
 def find_coordination_service():
     """Find the coordination service file"""
     possible_paths = [
@@ -44,28 +72,33 @@ def add_schedule_endpoints(filepath):
     # Read the file
     with open(filepath, 'r') as f:
         content = f.read()
-        lines = content.split('\n')
     
-    # Find where to insert the new routes (after _setup_routes definition)
-    insert_index = None
+    # Plain substring checks first: nothing to do if the routes are already
+    # there, and no point running the regexes if the marker is missing
+    if '/schedule/status' in content:
+        print("✓ Schedule endpoints already present, file not modified")
+        return True
+    if content.find('def _setup_routes(self):') < 0:
+        print("✗ Could not find appropriate location to insert routes")
+        return False
+    
+    # Find where to insert the new routes (after _setup_routes definition):
+    # the start of the line before the next method that follows it,
+    # indented like the first route registered in between
+    insert_at = None
     indent_level = None
     
-    for i, line in enumerate(lines):
-        if 'def _setup_routes(self):' in line:
-            # Find the last route definition in this method
-            for j in range(i + 1, len(lines)):
-                if lines[j].strip().startswith('def ') and not lines[j].strip().startswith('def health'):
-                    # Found the end of _setup_routes
-                    insert_index = j - 1
-                    # Find a route definition to match indentation
-                    for k in range(i + 1, j):
-                        if '@self.app.route' in lines[k]:
-                            indent_level = len(lines[k]) - len(lines[k].lstrip())
-                            break
-                    break
-            break
+    setup = _RE_SETUP.search(content)
+    if setup:
+        body_start = content.find('\n', setup.end()) + 1
+        next_def = _RE_DEF.search(content, body_start) if body_start else None
+        if next_def:
+            insert_at = content.rfind('\n', 0, next_def.start() - 1) + 1
+            route = _RE_ROUTE.search(content, body_start, next_def.start())
+            if route:
+                indent_level = len(route.group(1))
     
-    if insert_index is None or indent_level is None:
+    if insert_at is None or indent_level is None:
         print("✗ Could not find appropriate location to insert routes")
         return False
     
@@ -89,7 +122,7 @@ def add_schedule_endpoints(filepath):
 {indent}            next_run = self._last_cycle_time + timedelta(minutes=interval)
 {indent}            next_run_str = next_run.strftime('%Y-%m-%d %H:%M:%S')
 {indent}        else:
-{indent}            next_run_str = f"In {interval} minutes"
+{indent}            next_run_str = f"In {{interval}} minutes"
 {indent}        
 {indent}        return jsonify({{
 {indent}            "enabled": True,
@@ -130,19 +163,12 @@ def add_schedule_endpoints(filepath):
 {indent}            return jsonify({{"error": str(e)}}), 500
 '''
     
-    # Insert the new routes
-    lines.insert(insert_index, new_routes)
-    
-    # Now add the helper methods at the class level
-    # Find the end of the class
-    class_end_index = None
-    for i in range(len(lines) - 1, -1, -1):
-        if lines[i].strip() and not lines[i].startswith(' ') and not lines[i].startswith('\t'):
-            class_end_index = i
-            break
-    
-    if class_end_index is None:
-        class_end_index = len(lines) - 1
+    # Now add the helper methods at the class level: before the last
+    # unindented line after the routes (the end of the class), or ahead of
+    # the routes themselves when the class runs to the end of the file
+    class_end = None
+    for match in _RE_TOP_LEVEL.finditer(content, insert_at):
+        class_end = match.start()
     
     # Add helper methods
     helper_methods = '''
@@ -235,11 +261,13 @@ def add_schedule_endpoints(filepath):
             self.logger.info("Trading scheduler stopped")
 '''
     
-    # Insert helper methods before the class end
-    lines.insert(class_end_index, helper_methods)
-    
-    # Write the modified content
-    modified_content = '\n'.join(lines)
+    # Splice both blocks into the original text
+    if class_end is None:
+        modified_content = (content[:insert_at] + helper_methods + '\n' + new_routes + '\n' +
+                            content[insert_at:])
+    else:
+        modified_content = (content[:insert_at] + new_routes + '\n' + content[insert_at:class_end] +
+                            helper_methods + '\n' + content[class_end:])
     
     # Save to file
     with open(filepath, 'w') as f:
@@ -250,21 +278,15 @@ def add_schedule_endpoints(filepath):
 
 def verify_changes(filepath):
     """Verify the changes were applied correctly"""
-    with open(filepath, 'r') as f:
+    with open(filepath, 'rb') as f:
         content = f.read()
     
-    checks = [
-        ('/schedule/status', "schedule/status endpoint"),
-        ('/schedule/config', "schedule/config endpoint"),
-        ('_get_schedule_config', "_get_schedule_config method"),
-        ('_save_schedule_config', "_save_schedule_config method"),
-        ('_start_scheduler', "_start_scheduler method"),
-        ('_stop_scheduler', "_stop_scheduler method")
-    ]
+    # One scan for all markers instead of a substring search per marker
+    found = {match.group().decode() for match in _VERIFY_RE.finditer(content)}
     
     all_good = True
-    for check_str, desc in checks:
-        if check_str in content:
+    for check_str, desc in _VERIFY_CHECKS:
+        if check_str in found:
             print(f"✓ Found {desc}")
         else:
             print(f"✗ Missing {desc}")
@@ -4,9 +4,16 @@ Fix Schedule Sync Issue
 Ensures both /schedule/status and /schedule/config use the same data
 """
 
+import atexit
 import json
 import os
 import requests
+from requests.adapters import HTTPAdapter
+
+# Every call goes to the coordination service: keep one persistent connection
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+atexit.register(SESSION.close)
 
 print("=" * 60)
 print("FIXING SCHEDULE SYNCHRONIZATION")
@@ -25,13 +32,23 @@ config_data = {
     "excluded_days": ["Saturday", "Sunday"]
 }
 
+# Serialized once; the same bytes go to every location below
+payload = json.dumps(config_data, indent=2).encode()
+
+def write_config(path):
+    """Write the serialized config to path with a single write call"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
 # Save to current directory
 config_path = './schedule_config.json'
-with open(config_path, 'w') as f:
-    json.dump(config_data, f, indent=2)
+write_config(config_path)
 
 print(f"✓ Created {config_path}")
-print(f"  Contents: {json.dumps(config_data, indent=2)}")
+print(f"  Contents: {payload.decode()}")
 
 # 2. Also save to other possible locations
 alt_paths = [
@@ -43,8 +60,7 @@ for path in alt_paths:
     try:
         dir_path = os.path.dirname(path)
         if dir_path and os.path.exists(dir_path):
-            with open(path, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            write_config(path)
             print(f"✓ Also created {path}")
     except:
         pass
@@ -53,7 +69,7 @@ for path in alt_paths:
 print("\n2. Forcing coordination service to reload configuration...")
 
 try:
-    response = requests.post('http://localhost:5000/schedule/config', json=config_data)
+    response = SESSION.post('http://localhost:5000/schedule/config', json=config_data)
     if response.status_code == 200:
         print("✓ Successfully updated configuration via API")
     else:
@@ -67,13 +83,13 @@ print("-" * 40)
 
 try:
     # Check status
-    status_response = requests.get('http://localhost:5000/schedule/status')
+    status_response = SESSION.get('http://localhost:5000/schedule/status')
     if status_response.status_code == 200:
         status_data = status_response.json()
         print(f"Status endpoint - enabled: {status_data.get('enabled')}")
     
     # Check config
-    config_response = requests.get('http://localhost:5000/schedule/config')
+    config_response = SESSION.get('http://localhost:5000/schedule/config')
     if config_response.status_code == 200:
         config_data = config_response.json()
         print(f"Config endpoint - enabled: {config_data.get('enabled')}")
@@ -177,7 +193,7 @@ import time
 time.sleep(2)  # Give it a moment
 
 try:
-    response = requests.get('http://localhost:5000/schedule/status')
+    response = SESSION.get('http://localhost:5000/schedule/status')
     if response.status_code == 200:
         data = response.json()
         if data.get('enabled'):
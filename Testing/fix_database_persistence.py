@@ -30,34 +30,37 @@ def sync_services_to_database():
             print("⚠️ No services found in memory")
             return False
         
+        now = datetime.now().isoformat()
+        rows = [(
+            service.get('service_name', service.get('name', 'unknown')),
+            service.get('host', 'localhost'),
+            service.get('port', 0),
+            service.get('status', 'running'),
+            now,
+            service.get('start_time', now),
+            json.dumps(service)
+        ) for service in services]
+        
         # Connect to database
         conn = sqlite3.connect('./trading_system.db')
+        conn.execute("PRAGMA synchronous = NORMAL")
         cursor = conn.cursor()
         
-        # Clear existing registrations
+        # Clear existing registrations and insert every service in the same
+        # transaction, one prepared statement for all rows
         cursor.execute("DELETE FROM service_coordination")
-        
-        # Insert each service
-        for service in services:
-            cursor.execute('''
-                INSERT INTO service_coordination 
-                (service_name, host, port, status, last_heartbeat, start_time, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                service.get('service_name', service.get('name', 'unknown')),
-                service.get('host', 'localhost'),
-                service.get('port', 0),
-                service.get('status', 'running'),
-                datetime.now().isoformat(),
-                service.get('start_time', datetime.now().isoformat()),
-                json.dumps(service)
-            ))
-            
-            print(f"  ✅ Synced {service.get('service_name', service.get('name'))}")
+        cursor.executemany('''
+            INSERT INTO service_coordination 
+            (service_name, host, port, status, last_heartbeat, start_time, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
         
         conn.commit()
         conn.close()
         
+        for service in services:
+            print(f"  ✅ Synced {service.get('service_name', service.get('name'))}")
+        
         print(f"✅ Successfully synced {len(services)} services to database")
         return True
         
@@ -84,37 +87,41 @@ def sync_trading_cycles_to_database():
             print("⚠️ No trading cycles found in API")
             return True  # Not an error, just empty
         
+        now = datetime.now()
+        rows = [(
+            cycle.get('cycle_id', f"cycle_{now.strftime('%Y%m%d_%H%M%S')}"),
+            cycle.get('status', 'unknown'),
+            cycle.get('start_time', now.isoformat()),
+            cycle.get('end_time'),
+            cycle.get('securities_scanned', 0),
+            cycle.get('patterns_found', 0),
+            cycle.get('trades_executed', 0),
+            cycle.get('error_count', 0),
+            cycle.get('created_at', now.isoformat())
+        ) for cycle in cycles]
+        
         # Connect to database  
         conn = sqlite3.connect('./trading_system.db')
+        conn.execute("PRAGMA synchronous = NORMAL")
         cursor = conn.cursor()
         
         # Clear existing cycles (if this is a sync operation)
         # cursor.execute("DELETE FROM trading_cycles")
         
-        # Insert or update each cycle
-        for cycle in cycles:
-            cursor.execute('''
-                INSERT OR REPLACE INTO trading_cycles 
-                (cycle_id, status, start_time, end_time, securities_scanned, 
-                 patterns_found, trades_executed, error_count, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                cycle.get('cycle_id', f"cycle_{datetime.now().strftime('%Y%m%d_%H%M%S')}"),
-                cycle.get('status', 'unknown'),
-                cycle.get('start_time', datetime.now().isoformat()),
-                cycle.get('end_time'),
-                cycle.get('securities_scanned', 0),
-                cycle.get('patterns_found', 0),
-                cycle.get('trades_executed', 0),
-                cycle.get('error_count', 0),
-                cycle.get('created_at', datetime.now().isoformat())
-            ))
-            
-            print(f"  ✅ Synced cycle {cycle.get('cycle_id')}")
+        # Insert or update every cycle in one transaction
+        cursor.executemany('''
+            INSERT OR REPLACE INTO trading_cycles 
+            (cycle_id, status, start_time, end_time, securities_scanned, 
+             patterns_found, trades_executed, error_count, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
         
         conn.commit()
         conn.close()
         
+        for cycle in cycles:
+            print(f"  ✅ Synced cycle {cycle.get('cycle_id')}")
+        
         print(f"✅ Successfully synced {len(cycles)} cycles to database")
         return True
         
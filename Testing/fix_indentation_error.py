@@ -2,9 +2,10 @@
 """
 Name of Service: Fix Paper Trading Indentation Error
 Filename: fix_indentation_error.py
-Version: 1.0.0
-Last Updated: 2025-06-25
+Version: 1.0.1
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.0.1 (2026-10-18) - Backup made with _backup.clone_file() (reflink where the filesystem supports it)
 v1.0.0 (2025-06-25) - Fix indentation error in paper_trading.py
   - Fixes the try block indentation
   - Maintains backward compatibility
@@ -16,9 +17,10 @@ indentation after the try statement.
 """
 
 import os
-import shutil
 from datetime import datetime
 
+from _backup import clone_file
+
 def fix_indentation():
     """Fix the indentation error in paper_trading.py"""
     
@@ -51,7 +53,7 @@ def fix_indentation():
     
     # Create a new backup before fixing
     backup_path = f'{paper_trading_path}.backup_fix_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
-    shutil.copy(paper_trading_path, backup_path)
+    clone_file(paper_trading_path, backup_path)
     print(f"✓ Created new backup: {backup_path}")
     
     # Write the fixed file
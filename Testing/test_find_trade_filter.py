@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Name of Service: Test Find Trade Filter
+Filename: test_find_trade_filter.py
+Version: 1.0.0
+Last Updated: 2026-10-18
+REVISION HISTORY:
+v1.0.0 (2026-10-18) - Check the validation scan of find_trade_filter.py
+  - Two checks on one line are both reported
+  - Hits match the one-regex-per-pattern scan it replaced
+
+DESCRIPTION:
+Runs find_validation_checks() on a small source sample and compares it
+with running each validation pattern over the whole text separately.
+"""
+
+import re
+
+from find_trade_filter import VALIDATION_PATTERNS, find_validation_checks
+
+SAMPLE = b"""class PaperTradingService:
+    def validate_signal(self, signal):
+        if confidence > 0.5 and quantity > 0:
+            return True
+        if signal_type in ('BUY', 'SELL') and confidence >= 0.7:
+            return True
+        return False
+
+    def _execute_trades(self, signals):
+        if quantity <= 0:
+            return []"""
+
+def line_of(offset):
+    return SAMPLE.count(b'\n', 0, offset) + 1
+
+def per_pattern_hits(buf):
+    """What the original scan reported: each pattern run over the whole text"""
+    return sorted((match.start(), name, match.group())
+                  for name, pattern in VALIDATION_PATTERNS.items()
+                  for match in re.finditer(pattern.pattern, buf, re.IGNORECASE))
+
+def test_two_checks_on_one_line():
+    """Both checks on a line are reported, not only the first pattern's"""
+    print("=" * 60)
+    print("TESTING VALIDATION SCAN")
+    print("=" * 60)
+    
+    hits = find_validation_checks(SAMPLE)
+    for offset, name, text in hits:
+        print(f"Line {line_of(offset)} [{name}]: {text.decode()}")
+    
+    names = {(line_of(offset), name) for offset, name, _ in hits}
+    assert (3, 'confidence') in names and (3, 'quantity') in names, names
+    assert (5, 'signal_type') in names and (5, 'confidence') in names, names
+    assert sorted(hits) == per_pattern_hits(SAMPLE)
+    print("\n✓ Every validation check reported")
+
+if __name__ == "__main__":
+    test_two_checks_on_one_line()
@@ -1,8 +1,9 @@
 """
 Name of Service: TRADING SYSTEM PHASE 1 - COORDINATION SERVICE
-Version: 1.1.0
-Last Updated: 2025-06-26
+Version: 1.1.1
+Last Updated: 2026-10-18
 REVISION HISTORY:
+v1.1.1 (2026-10-18) - Added /register_services_bulk to persist several registrations in one transaction
 v1.1.0 (2025-06-26) - Enhanced workflow status API with phases data from workflow_tracking table, fixed timezone to Asia/Singapore (+8 UTC)
 v1.0.9 (2025-06-26) - Fixed database persistence for service registrations and workflow tracking
 v1.0.8 (2025-06-24) - Added missing API endpoints for web dashboard compatibility 
@@ -44,7 +45,7 @@ class CoordinationService:
         self.app = Flask(__name__)
         self.port = port
         self.db_path = db_path
-        self.service_version = "1.1.0"
+        self.service_version = "1.1.1"
         self.logger = self._setup_logging()
         
         # Initialize database utilities if available
@@ -195,28 +196,29 @@ class CoordinationService:
     
     def _save_service_registration_to_db(self, service_name: str, service_info: dict):
         """Save service registration to database with retry logic"""
+        self._save_service_registrations_to_db({service_name: service_info})
+    
+    def _save_service_registrations_to_db(self, registrations: Dict[str, dict]):
+        """Save several service registrations in one transaction with retry logic"""
         max_retries = 5
         for attempt in range(max_retries):
             try:
                 conn = self.get_db_connection()
                 cursor = conn.cursor()
                 
-                cursor.execute('''
+                now = datetime.now()
+                cursor.executemany('''
                     INSERT OR REPLACE INTO service_coordination 
                     (service_name, service_url, service_port, status, last_heartbeat, updated_at)
                     VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    service_name,
-                    service_info['url'],
-                    service_info['port'],
-                    'active',
-                    datetime.now(),
-                    datetime.now()
-                ))
+                ''', [
+                    (service_name, service_info['url'], service_info['port'], 'active', now, now)
+                    for service_name, service_info in registrations.items()
+                ])
                 
                 conn.commit()
                 conn.close()
-                self.logger.info(f"Persisted service registration: {service_name}")
+                self.logger.info(f"Persisted service registration: {', '.join(registrations)}")
                 return  # Success
                 
             except sqlite3.OperationalError as e:
@@ -380,6 +382,31 @@ class CoordinationService:
             self.logger.info(f"Registered service: {service_name} on port {port}")
             return jsonify({"status": "registered", "service": service_name})
         
+        @self.app.route('/register_services_bulk', methods=['POST'])
+        def register_services_bulk():
+            """Register several services with the coordinator in one request"""
+            services = (request.json or {}).get('services') or []
+            
+            if not services or not all(s.get('service_name') and s.get('port') for s in services):
+                return jsonify({"error": "services list with service_name and port required"}), 400
+            
+            registrations = {
+                s['service_name']: {
+                    'url': f"http://localhost:{s['port']}",
+                    'port': s['port'],
+                    'status': 'active',
+                    'last_heartbeat': datetime.now().isoformat()
+                }
+                for s in services
+            }
+            self.service_registry.update(registrations)
+            
+            # Persist to database
+            self._save_service_registrations_to_db(registrations)
+            
+            self.logger.info(f"Registered services: {', '.join(registrations)}")
+            return jsonify({"status": "registered", "services": list(registrations)})
+        
         # Web Dashboard Compatible Endpoints
         @self.app.route('/api/schedule_status', methods=['GET'])
         def api_schedule_status():